@@ -0,0 +1,8 @@
+"""Multi-agent workload simulator for capacity planning.
+
+Run ``python -m app.loadgen --help`` for the command-line harness.
+"""
+
+from app.loadgen.runner import LoadProfile, LoadReport, local_uvicorn, run_load
+
+__all__ = ["LoadProfile", "LoadReport", "local_uvicorn", "run_load"]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from app.loadgen.runner import DEFAULT_ITERATIONS, DEFAULT_MIX, LoadProfile, local_uvicorn, run_load
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        try:
+            mix[name.strip()] = float(weight) if weight else 1.0
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"Invalid mix weight in {item!r}") from exc
+    return mix
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.loadgen", description=__doc__)
+    parser.add_argument(
+        "--target",
+        default="asgi",
+        help="'asgi' (in-process), 'uvicorn' (local server thread) or a base URL such as http://127.0.0.1:8000",
+    )
+    parser.add_argument("--agents", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="Scenarios per agent; ignored with --duration")
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds instead")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="Scenario weights, e.g. workflow=5,intake=1,statements=1,packet=1,poll=2",
+    )
+    parser.add_argument("--statements", type=int, default=5, help="Statements per validation batch")
+    parser.add_argument("--evidence", type=int, default=8, help="Evidence objects per validation batch")
+    parser.add_argument("--criteria", type=int, default=3, help="Acceptance criteria per packet")
+    parser.add_argument("--audit-payload-bytes", type=int, default=256)
+    parser.add_argument("--invalid-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(
+        agents=args.agents,
+        iterations=None if args.duration else args.iterations,
+        duration=args.duration,
+        mix=args.mix,
+        statements_per_batch=args.statements,
+        evidence_per_batch=args.evidence,
+        acceptance_criteria=args.criteria,
+        audit_payload_bytes=args.audit_payload_bytes,
+        invalid_ratio=args.invalid_ratio,
+        seed=args.seed,
+    )
+
+    if args.target in {"asgi", "uvicorn"}:
+        from app.main import app
+
+        if args.target == "asgi":
+            report = asyncio.run(run_load(profile, app=app))
+        else:
+            with local_uvicorn(app) as base_url:
+                report = asyncio.run(run_load(profile, base_url=base_url))
+    else:
+        report = asyncio.run(run_load(profile, base_url=args.target))
+
+    print(report.model_dump_json(indent=2) if args.json else report.render())
+    return 0 if report.audit_chain_valid else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import socket
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterator
+from uuid import uuid4
+
+import httpx
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.loadgen import scenarios
+
+SCENARIOS = ("workflow", "intake", "statements", "packet", "poll")
+DEFAULT_MIX = {"workflow": 5.0, "intake": 1.0, "statements": 1.0, "packet": 1.0, "poll": 2.0}
+DEFAULT_ITERATIONS = 20
+CHAIN_CONFLICT_DETAIL = "previous_event_hash mismatch"
+
+
+class LoadProfile(BaseModel):
+    agents: int = Field(default=8, ge=1)
+    iterations: int | None = Field(default=None, ge=1)
+    duration: float | None = Field(default=None, gt=0)
+    mix: dict[str, float] = Field(default_factory=lambda: dict(DEFAULT_MIX))
+    statements_per_batch: int = Field(default=5, ge=1)
+    evidence_per_batch: int = Field(default=8, ge=1)
+    acceptance_criteria: int = Field(default=3, ge=1)
+    audit_payload_bytes: int = Field(default=256, ge=0)
+    invalid_ratio: float = Field(default=0.1, ge=0, le=1)
+    max_chain_retries: int = Field(default=8, ge=1)
+    seed: int = 0
+
+    @field_validator("mix")
+    @classmethod
+    def mix_must_name_known_scenarios(cls, mix: dict[str, float]) -> dict[str, float]:
+        unknown = sorted(set(mix) - set(SCENARIOS))
+        if unknown:
+            raise ValueError(f"Unknown scenarios in mix: {unknown}")
+        if not any(weight > 0 for weight in mix.values()):
+            raise ValueError("mix needs at least one positive weight")
+        return mix
+
+    @model_validator(mode="before")
+    @classmethod
+    def default_to_iterations(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "iterations" not in data and data.get("duration") is None:
+            return {**data, "iterations": DEFAULT_ITERATIONS}
+        return data
+
+    @model_validator(mode="after")
+    def exactly_one_stop_condition(self) -> LoadProfile:
+        if (self.iterations is None) == (self.duration is None):
+            raise ValueError("Set exactly one of iterations or duration")
+        return self
+
+
+class OperationStats(BaseModel):
+    operation: str
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class LoadReport(BaseModel):
+    agents: int
+    elapsed_s: float
+    requests: int
+    throughput_rps: float
+    workflows_completed: int
+    error_rate: float
+    chain_conflicts: int
+    chain_retries_exhausted: int
+    operations: list[OperationStats]
+    audit_chain_valid: bool
+    audit_events_checked: int
+    audit_issues: list[str]
+
+    def render(self) -> str:
+        lines = [
+            f"agents={self.agents} elapsed={self.elapsed_s:.2f}s requests={self.requests} "
+            f"throughput={self.throughput_rps:.1f} req/s workflows={self.workflows_completed}",
+            f"error_rate={self.error_rate:.2%} chain_conflicts={self.chain_conflicts} "
+            f"chain_retries_exhausted={self.chain_retries_exhausted} audit_chain_valid={self.audit_chain_valid} audit_events={self.audit_events_checked}",
+            f"{'operation':<22}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for stats in self.operations:
+            lines.append(
+                f"{stats.operation:<22}{stats.count:>8}{stats.errors:>8}"
+                f"{stats.p50_ms:>10.2f}{stats.p95_ms:>10.2f}{stats.p99_ms:>10.2f}{stats.max_ms:>10.2f}"
+            )
+        lines.extend(f"audit issue: {issue}" for issue in self.audit_issues)
+        return "\n".join(lines)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.chain_conflicts = 0
+        self.chain_retries_exhausted = 0
+        self.workflows_completed = 0
+
+    def record(self, operation: str, elapsed_ms: float, error: bool) -> None:
+        self.latencies[operation].append(elapsed_ms)
+        if error:
+            self.errors[operation] += 1
+
+    def operations(self) -> list[OperationStats]:
+        stats: list[OperationStats] = []
+        for operation in sorted(self.latencies):
+            values = sorted(self.latencies[operation])
+            stats.append(
+                OperationStats(
+                    operation=operation,
+                    count=len(values),
+                    errors=self.errors[operation],
+                    p50_ms=percentile(values, 0.50),
+                    p95_ms=percentile(values, 0.95),
+                    p99_ms=percentile(values, 0.99),
+                    max_ms=values[-1],
+                )
+            )
+        return stats
+
+
+class SimulatedAgent:
+    """One agent following the charter workflow: intake → statements → packet handoff.
+
+    Audit events are appended against the live chain head; a head that moved
+    underneath the agent is counted as a chain conflict and retried. Any other
+    rejection is an ``audit_append`` error and is not retried.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        client: httpx.AsyncClient,
+        profile: LoadProfile,
+        metrics: Metrics,
+        run_id: str,
+    ) -> None:
+        self.name = f"agent-{index}"
+        self._client = client
+        self._profile = profile
+        self._metrics = metrics
+        self._run_id = run_id
+        self._rng = random.Random(profile.seed * 1_000_003 + index)
+        self._sequence = 0
+        self._audit_cursor: str | None = None
+        self._audit_etag: str | None = None
+        scenario_weights = [(name, weight) for name, weight in profile.mix.items() if weight > 0]
+        self._scenarios = [name for name, _ in scenario_weights]
+        self._weights = [weight for _, weight in scenario_weights]
+
+    async def run(self, deadline: float | None) -> None:
+        iteration = 0
+        while True:
+            if self._profile.iterations is not None and iteration >= self._profile.iterations:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            scenario = self._rng.choices(self._scenarios, weights=self._weights)[0]
+            await getattr(self, f"_run_{scenario}")()
+            iteration += 1
+
+    async def _call(
+        self,
+        operation: str,
+        method: str,
+        path: str,
+        expected: tuple[int, ...] = (200,),
+        **kwargs,
+    ) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.HTTPError:
+            self._metrics.record(operation, (time.perf_counter() - started) * 1000, error=True)
+            return None
+        self._metrics.record(
+            operation,
+            (time.perf_counter() - started) * 1000,
+            error=response.status_code not in expected,
+        )
+        return response
+
+    def _invalid(self) -> bool:
+        return self._rng.random() < self._profile.invalid_ratio
+
+    async def _emit_audit(self, event_type: str) -> bool:
+        self._sequence += 1
+        event_id = f"{self._run_id}-{self.name}-{self._sequence}"
+        for attempt in range(self._profile.max_chain_retries):
+            if attempt:
+                # Randomised backoff so agents racing for the same head do not retry in lockstep.
+                await asyncio.sleep(self._rng.uniform(0, 0.002 * attempt))
+            head = await self._call("audit_head", "GET", "/audit/head")
+            if head is None or head.status_code != 200:
+                return False
+            event = scenarios.audit_event(
+                event_id,
+                event_type,
+                self.name,
+                head.json()["head_hash"],
+                self._profile.audit_payload_bytes,
+            )
+            response = await self._call("audit_append", "POST", "/audit/events", expected=(200, 400), json=event)
+            if response is None:
+                return False
+            if response.status_code == 200:
+                return True
+            if response.json().get("detail") != CHAIN_CONFLICT_DETAIL:
+                self._metrics.errors["audit_append"] += 1
+                return False
+            self._metrics.chain_conflicts += 1
+        self._metrics.chain_retries_exhausted += 1
+        return False
+
+    @staticmethod
+    def _succeeded(response: httpx.Response | None) -> bool:
+        return response is not None and response.status_code == 200
+
+    async def _run_intake(self) -> bool:
+        payload = scenarios.intake_payload(self._rng, invalid=self._invalid())
+        response = await self._call("intake_validate", "POST", "/intake/validate", json=payload)
+        return self._succeeded(response) and await self._emit_audit("intake_validated")
+
+    async def _run_statements(self) -> bool:
+        payload = scenarios.statement_batch(
+            self._rng,
+            self._profile.statements_per_batch,
+            self._profile.evidence_per_batch,
+            invalid=self._invalid(),
+        )
+        if not await self._emit_audit("prompt_captured"):
+            return False
+        response = await self._call("statements_validate", "POST", "/evidence/statements/validate", json=payload)
+        return self._succeeded(response) and await self._emit_audit("output_generated")
+
+    async def _run_packet(self) -> bool:
+        """Run one handoff; True only if every step succeeded and the packet ended approved."""
+        self._sequence += 1
+        packet_id = f"PKT-{self._run_id}-{self.name}-{self._sequence}"
+        approved = not self._invalid()
+        draft = scenarios.handoff_packet(self._rng, packet_id, self._profile.acceptance_criteria, approved=False)
+        validated = await self._call("packet_validate", "POST", "/workflow/packets/validate", json=draft)
+        if not self._succeeded(validated):
+            return False
+        registered = await self._call(
+            "packet_register",
+            "POST",
+            "/workflow/packets",
+            json={"packet": draft, "actor": self.name},
+        )
+        if not self._succeeded(registered):
+            return False
+        for state in ("submitted", "in_review"):
+            moved = await self._call(
+                "packet_transition",
+                "POST",
+                f"/workflow/packets/{packet_id}/transitions",
+                json={"to_state": state, "actor": self.name},
+            )
+            if not self._succeeded(moved):
+                return False
+        final = scenarios.handoff_packet(self._rng, packet_id, self._profile.acceptance_criteria, approved=approved)
+        # A 409 for a deliberately unapproved packet is an expected denial, not an error, but the handoff is not complete.
+        response = await self._call(
+            "packet_transition",
+            "POST",
+            f"/workflow/packets/{packet_id}/transitions",
+            expected=(200, 409),
+            json={"to_state": "approved", "actor": "RA&QA", "packet": final},
+        )
+        return self._succeeded(response) and await self._emit_audit("handoff_completed")
+
+    async def _run_workflow(self) -> None:
+        if await self._run_intake() and await self._run_statements() and await self._run_packet():
+            self._metrics.workflows_completed += 1
+
+    async def _run_poll(self) -> None:
+        params = {"since": self._audit_cursor} if self._audit_cursor else {}
+        headers = {"If-None-Match": self._audit_etag} if self._audit_etag else {}
+        response = await self._call("audit_poll", "GET", "/audit/delta", expected=(200, 304), params=params, headers=headers)
+        if response is not None and response.status_code == 200:
+            body = response.json()
+            self._audit_cursor = body["head_hash"] or self._audit_cursor
+            self._audit_etag = response.headers.get("ETag")
+
+
+async def run_load(profile: LoadProfile, app=None, base_url: str | None = None) -> LoadReport:
+    """Drive ``profile.agents`` concurrent agents against an ASGI app in-process, or a server at ``base_url``."""
+    if (app is None) == (base_url is None):
+        raise ValueError("Provide exactly one of app or base_url")
+    transport = httpx.ASGITransport(app=app) if app is not None else None
+    metrics = Metrics()
+    run_id = uuid4().hex[:8]
+
+    async with httpx.AsyncClient(transport=transport, base_url=base_url or "http://loadgen", timeout=60) as client:
+        agents = [SimulatedAgent(index, client, profile, metrics, run_id) for index in range(profile.agents)]
+        started = time.perf_counter()
+        deadline = started + profile.duration if profile.duration is not None else None
+        await asyncio.gather(*(agent.run(deadline) for agent in agents))
+        elapsed = time.perf_counter() - started
+        verification = (await client.get("/audit/verify")).json()
+
+    requests = sum(len(values) for values in metrics.latencies.values())
+    errors = sum(metrics.errors.values())
+    return LoadReport(
+        agents=profile.agents,
+        elapsed_s=elapsed,
+        requests=requests,
+        throughput_rps=requests / elapsed if elapsed else 0.0,
+        workflows_completed=metrics.workflows_completed,
+        error_rate=errors / requests if requests else 0.0,
+        chain_conflicts=metrics.chain_conflicts,
+        chain_retries_exhausted=metrics.chain_retries_exhausted,
+        operations=metrics.operations(),
+        audit_chain_valid=verification["valid"],
+        audit_events_checked=verification["checked_events"],
+        audit_issues=[issue["code"] for issue in verification["issues"]],
+    )
+
+
+@contextmanager
+def local_uvicorn(app, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve ``app`` with uvicorn on a background thread and yield its base URL."""
+    import uvicorn
+
+    if port == 0:
+        with socket.socket() as probe:
+            probe.bind((host, 0))
+            port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    try:
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("uvicorn failed to start")
+            time.sleep(0.05)
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+
+
+def intake_payload(rng: random.Random, invalid: bool = False) -> dict:
+    markets = rng.sample(["US", "EU", "CA", "UK", "JP"], k=rng.randint(1, 3))
+    payload = {
+        "device_class": rng.choice(["I", "II", "III"]),
+        "intended_use": {
+            "clinical_condition": "Atrial fibrillation risk screening",
+            "target_population": "Adults",
+            "intended_user": "Cardiologists",
+            "use_environment": rng.choice(["Hospital", "Home", "Clinic"]),
+            "primary_output_and_decision_impact": "Risk score used for triage",
+            "exclusions_or_contraindications": "None known",
+        },
+        "technology": {
+            "product_modality": "SaMD",
+            "primary_technical_mechanism": "ML classification",
+            "data_inputs_and_dependencies": "ECG waveform and demographics",
+            "ai_ml_behavior": rng.choice(["locked", "adaptive"]),
+        },
+        "software_hardware_scope": {
+            "software_components": ["mobile app", "backend api"],
+            "hardware_components": ["none"],
+            "external_interfaces": ["ehr"],
+            "cybersecurity_trust_boundaries": ["mobile->cloud"],
+        },
+        "target_markets": markets,
+        "primary_launch_market": markets[0],
+        "risk_class": [
+            {
+                "market": market,
+                "proposed_classification": "Class II",
+                "rationale": "predicate hypothesis",
+                "confidence": rng.choice(["high", "medium", "low"]),
+                "open_questions": [],
+                "mitigation_plan": "Pre-submission meeting",
+            }
+            for market in markets
+        ],
+        "clinical_strategy": {
+            "evidence_sources": ["literature", "retrospective study"],
+            "study_design_assumptions": ["multicenter retrospective"],
+            "primary_endpoints": ["sensitivity", "specificity"],
+            "acceptance_criteria": [">=0.85 sensitivity"],
+            "gaps_and_mitigation_plan": "Prospective study planned.",
+            "lifecycle_monitoring_plan": "Quarterly drift monitoring",
+        },
+        "manufacturing_context": {
+            "organization_model": "in-house software",
+            "qms_status": "ISO 13485 implemented",
+            "critical_suppliers": ["cloud vendor"],
+            "process_controls": ["design control", "change control"],
+            "post_market_change_control_owner": "RA/QA",
+        },
+    }
+    if invalid:
+        payload["intended_use"].pop("target_population")
+    return payload
+
+
+def statement_batch(rng: random.Random, statements: int, evidence: int, invalid: bool = False) -> dict:
+    now = datetime.now(timezone.utc).isoformat()
+    evidence_objects = [
+        {
+            "id": f"EV-{index:04d}",
+            "source": "V&V report",
+            "version": "v1",
+            "owner": "RA&QA",
+            "timestamp": now,
+            "jurisdiction_relevance": rng.sample(["US", "EU", "CA"], k=rng.randint(1, 3)),
+            "confidence": rng.choice(["high", "medium", "low"]),
+        }
+        for index in range(evidence)
+    ]
+    evidence_ids = [evidence_object["id"] for evidence_object in evidence_objects]
+    candidates = [
+        {
+            "statement": f"Claim {index} is supported by objective evidence.",
+            "evidence_ids": rng.sample(evidence_ids, k=min(len(evidence_ids), rng.randint(1, 3))),
+            "target_jurisdictions": rng.sample(["US", "EU"], k=1),
+        }
+        for index in range(statements)
+    ]
+    if invalid and candidates:
+        candidates[0]["evidence_ids"] = ["EV-MISSING"]
+    return {"statements": candidates, "evidence_objects": evidence_objects}
+
+
+def handoff_packet(rng: random.Random, packet_id: str, criteria: int, approved: bool = True) -> dict:
+    now = datetime.now(timezone.utc).isoformat()
+    evidence_index = [f"EV-{packet_id}-{index}" for index in range(criteria)]
+    return {
+        "packet_id": packet_id,
+        "title": "Load generator handoff",
+        "owner_agent": "System Engineer/CTO",
+        "target_agent": "RA&QA",
+        "source_requirements": [{"id": f"REQ-{index}", "version": "v1"} for index in range(criteria)],
+        "risk_controls": [
+            {
+                "risk_id": f"HZ-{rng.randint(1, 999):03d}",
+                "control_id": f"RM-{packet_id}-{index}",
+                "verified": True,
+                "severity": rng.choice(["low", "medium", "high", "critical"]),
+            }
+            for index in range(criteria)
+        ],
+        "acceptance_criteria": [
+            {
+                "id": f"AC-{index}",
+                "statement": "Measured output meets threshold",
+                "verification_method": "test",
+                "evidence_ref": evidence_index[index],
+            }
+            for index in range(criteria)
+        ],
+        "evidence_index": evidence_index,
+        "required_approvers": ["RA&QA"],
+        "approval_log": (
+            [{"signer_role": "RA&QA", "decision": "approved", "timestamp": now}] if approved else []
+        ),
+    }
+
+
+def audit_event(event_id: str, event_type: str, actor: str, previous_hash: str | None, padding: int) -> dict:
+    return {
+        "event_id": event_id,
+        "event_type": event_type,
+        "actor": actor,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "payload": {"source": "loadgen", "detail": "x" * padding},
+        "previous_event_hash": previous_hash,
+    }
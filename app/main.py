@@ -1,19 +1,71 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.models import (
+    AuditDelta,
     AuditEvent,
+    AuditSegment,
+    ChainVerificationReport,
     EvidenceObject,
     HandoffPacket,
+    Hazard,
     IntakePayload,
+    PacketState,
+    PacketStatus,
+    ProcedureGateDecision,
+    ProcedureGateRequest,
+    ProcedureObject,
+    ResidualRiskRecord,
+    RiskControl,
+    RiskRollup,
+    RiskSeverity,
+    SlaEscalation,
     StatementCandidate,
 )
+from app.procedures import ProcedureRegistry
+from app.retention import AuditRetentionManager
+from app.risk import HIGH_SEVERITIES, RiskRegister
+from app.sync import AuditNotifier, ValidationCache, audit_event_stream, chain_etag, etag_matches, read_events
 from app.services import EvidencePolicy, ImmutableAuditLog, IntakeValidator, PacketValidator
+from app.workflow import PacketLifecycleService, PacketTransitionError, run_sla_escalations
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Escalations are raised by this driver, not by reads of /workflow/packets/escalations.
+    driver = asyncio.create_task(
+        run_sla_escalations(packet_lifecycle, float(os.environ.get("SLA_CHECK_INTERVAL_SECONDS", "60")))
+    )
+    try:
+        yield
+    finally:
+        driver.cancel()
+        with suppress(asyncio.CancelledError):
+            await driver
+
 
-app = FastAPI(title="Medical Regulation Platform MVP", version="0.1.0")
+app = FastAPI(title="Medical Regulation Platform MVP", version="0.1.0", lifespan=lifespan)
 audit_log = ImmutableAuditLog()
+audit_retention = AuditRetentionManager(
+    audit_log,
+    storage_dir=os.environ.get("AUDIT_SEGMENT_DIR") or None,
+    codec=os.environ.get("AUDIT_SEGMENT_CODEC", "zlib"),
+)
+packet_lifecycle = PacketLifecycleService(audit_log)
+procedure_registry = ProcedureRegistry(audit_log)
+risk_register = RiskRegister(audit_log)
+audit_notifier = AuditNotifier()
+audit_log.add_listener(audit_notifier)
+validation_cache = ValidationCache(app.version)
 
 
 class StatementValidationRequest(BaseModel):
@@ -22,33 +74,272 @@ class StatementValidationRequest(BaseModel):
     target_jurisdictions: list[str] = Field(default_factory=list)
 
 
+class PacketRegistrationRequest(BaseModel):
+    packet: HandoffPacket
+    actor: str
+
+
+class PacketTransitionRequest(BaseModel):
+    to_state: PacketState
+    actor: str
+    comment: str | None = None
+    packet: HandoffPacket | None = None
+
+
+class ProcedurePublishRequest(BaseModel):
+    procedure: ProcedureObject
+    actor: str
+
+
+class HazardRegistrationRequest(BaseModel):
+    hazard: Hazard
+    actor: str
+
+
+class RiskControlRegistrationRequest(BaseModel):
+    control: RiskControl
+    actor: str
+
+
+class ControlVerificationRequest(BaseModel):
+    verification_id: str
+    actor: str
+
+
+class ResidualRiskRequest(BaseModel):
+    record: ResidualRiskRecord
+    actor: str
+
+
+class PacketRiskIngestRequest(BaseModel):
+    device_id: str
+    packet: HandoffPacket
+    actor: str
+
+
+class SealRequest(BaseModel):
+    count: int | None = Field(default=None, ge=1)
+
+
+class LegalHoldRequest(BaseModel):
+    actor: str
+    reason: str
+
+
+class RetentionActionRequest(BaseModel):
+    actor: str
+
+
+def cached_validation(
+    kind: str,
+    payload: BaseModel,
+    compute: Callable[[], Any],
+    response: Response,
+    if_none_match: str | None,
+):
+    """Serve a validation result with an ETag that is a digest of the request body, not of the result.
+
+    A matching ``If-None-Match`` answers 412 Precondition Failed, as RFC 9110
+    §13.1.2 requires for methods other than GET/HEAD; the client replays the
+    result it already holds. ``If-None-Match: *`` is ignored: on a POST it
+    cannot mean the client already holds this body's result.
+    """
+    key = validation_cache.key(kind, payload)
+    etag = f'"{key}"'
+    if etag_matches(if_none_match, etag, allow_wildcard=False):
+        return Response(status_code=412, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return validation_cache.get_or_compute(key, compute)
+
+
+def resolve_since(since: str | None) -> int:
+    """Map a ``since`` cursor (event seq or hash) to the first seq not yet seen by the caller."""
+    if since is None:
+        return 0
+    if since.isdigit():
+        start = int(since) + 1
+        next_seq = audit_log.cursor[0]
+        if start > next_seq:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Audit cursor {since} is past the chain head (last seq {next_seq - 1})",
+            )
+        return start
+    try:
+        return audit_retention.seq_for_hash(since) + 1
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown audit cursor {since}") from exc
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
 @app.post("/intake/validate")
-def validate_intake(payload: IntakePayload):
-    return IntakeValidator.validate(payload)
+def validate_intake(
+    payload: IntakePayload,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
+    return cached_validation(
+        "intake",
+        payload,
+        lambda: IntakeValidator.validate(payload),
+        response,
+        if_none_match,
+    )
 
 
 @app.post("/evidence/statements/validate")
-def validate_statements(payload: StatementValidationRequest):
-    evidence_ids = {ev.id for ev in payload.evidence_objects}
-    confidence_map = {ev.id: ev.confidence for ev in payload.evidence_objects}
-    evidence_jurisdiction_map = {ev.id: ev.jurisdiction_relevance for ev in payload.evidence_objects}
-    return EvidencePolicy.validate_statements(
-        payload.statements,
-        evidence_ids,
-        confidence_map,
-        evidence_jurisdiction_map,
-        payload.target_jurisdictions,
-    )
+def validate_statements(
+    payload: StatementValidationRequest,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
+    def compute():
+        evidence_ids = {ev.id for ev in payload.evidence_objects}
+        confidence_map = {ev.id: ev.confidence for ev in payload.evidence_objects}
+        evidence_jurisdiction_map = {ev.id: ev.jurisdiction_relevance for ev in payload.evidence_objects}
+        return EvidencePolicy.validate_statements(
+            payload.statements,
+            evidence_ids,
+            confidence_map,
+            evidence_jurisdiction_map,
+            payload.target_jurisdictions,
+        )
+
+    return cached_validation("statements", payload, compute, response, if_none_match)
 
 
 @app.post("/workflow/packets/validate")
-def validate_packet(packet: HandoffPacket):
-    return PacketValidator.validate(packet)
+def validate_packet(
+    packet: HandoffPacket,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
+    return cached_validation(
+        "packet",
+        packet,
+        lambda: PacketValidator.validate(packet),
+        response,
+        if_none_match,
+    )
+
+
+@app.post("/workflow/packets")
+def register_packet(request: PacketRegistrationRequest) -> PacketStatus:
+    try:
+        return packet_lifecycle.register(request.packet, request.actor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.get("/workflow/packets/escalations")
+def list_packet_escalations() -> list[SlaEscalation]:
+    return packet_lifecycle.escalations()
+
+
+@app.get("/workflow/packets/{packet_id}")
+def get_packet_status(packet_id: str) -> PacketStatus:
+    try:
+        return packet_lifecycle.status(packet_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown packet {packet_id}") from exc
+
+
+@app.post("/workflow/packets/{packet_id}/transitions")
+def transition_packet(packet_id: str, request: PacketTransitionRequest) -> PacketStatus:
+    try:
+        return packet_lifecycle.transition(
+            packet_id,
+            request.to_state,
+            request.actor,
+            comment=request.comment,
+            packet=request.packet,
+        )
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown packet {packet_id}") from exc
+    except PacketTransitionError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": str(exc), "issues": [issue.model_dump() for issue in exc.issues]},
+        ) from exc
+
+
+@app.post("/procedures")
+def publish_procedure(request: ProcedurePublishRequest) -> dict[str, str]:
+    try:
+        compiled = procedure_registry.publish(request.procedure, request.actor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {
+        "sop_id": compiled.sop_id,
+        "revision": compiled.revision,
+        "effective_date": compiled.effective_date.isoformat(),
+    }
+
+
+@app.post("/procedures/gate")
+def check_procedure_gate(request: ProcedureGateRequest) -> ProcedureGateDecision:
+    return procedure_registry.check(request)
+
+
+@app.post("/risk/hazards")
+def register_hazard(request: HazardRegistrationRequest) -> Hazard:
+    try:
+        return risk_register.add_hazard(request.hazard, request.actor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/risk/controls")
+def register_risk_control(request: RiskControlRegistrationRequest) -> RiskControl:
+    try:
+        return risk_register.add_control(request.control, request.actor)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown hazard {request.control.hazard_id}") from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/risk/controls/{control_id}/verifications")
+def verify_risk_control(control_id: str, request: ControlVerificationRequest) -> RiskControl:
+    try:
+        return risk_register.verify_control(control_id, request.verification_id, request.actor)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown control {control_id}") from exc
+
+
+@app.post("/risk/residuals")
+def record_residual_risk(request: ResidualRiskRequest) -> ResidualRiskRecord:
+    try:
+        return risk_register.record_residual(request.record, request.actor)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown hazard {request.record.hazard_id}") from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/risk/packets")
+def ingest_packet_risks(request: PacketRiskIngestRequest) -> list[RiskControl]:
+    try:
+        return risk_register.ingest_packet(request.device_id, request.packet, request.actor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.get("/risk/devices/{device_id}/rollup")
+def get_risk_rollup(device_id: str) -> RiskRollup:
+    return risk_register.rollup(device_id)
+
+
+@app.get("/risk/devices/{device_id}/controls/unverified")
+def list_unverified_controls(
+    device_id: str,
+    severity: list[RiskSeverity] = Query(default=sorted(HIGH_SEVERITIES)),
+) -> list[RiskControl]:
+    return risk_register.unverified_controls(device_id, set(severity))
 
 
 @app.post("/audit/events")
@@ -60,5 +351,109 @@ def append_audit_event(event: AuditEvent):
 
 
 @app.get("/audit/events")
-def list_audit_events():
-    return audit_log.events
+def list_audit_events(response: Response, if_none_match: str | None = Header(default=None)):
+    base_seq, events, length = audit_log.snapshot()
+    head_hash = events[length - 1].hash if length else audit_log.head_hash
+    etag = chain_etag(base_seq + length, head_hash, base_seq=base_seq)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return events[:length]
+
+
+@app.get("/audit/head")
+def get_audit_head(response: Response, if_none_match: str | None = Header(default=None)):
+    next_seq, head_hash = audit_log.cursor
+    etag = chain_etag(next_seq, head_hash)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return {"next_seq": next_seq, "head_hash": head_hash}
+
+
+@app.get("/audit/delta")
+def get_audit_delta(
+    response: Response,
+    since: str | None = None,
+    limit: int = Query(default=500, ge=1, le=5000),
+    if_none_match: str | None = Header(default=None),
+):
+    next_seq, head_hash = audit_log.cursor
+    head_etag = chain_etag(next_seq, head_hash)
+    start = resolve_since(since)
+    if start >= next_seq and etag_matches(if_none_match, head_etag):
+        return Response(status_code=304, headers={"ETag": head_etag})
+
+    page = read_events(audit_retention, start, limit)
+    events = [event for _, event in page]
+    cursor = page[-1][0] + 1 if page else start
+    has_more = cursor < audit_log.cursor[0]
+    last_hash = events[-1].hash if events else head_hash
+    response.headers["ETag"] = chain_etag(cursor, last_hash)
+    return AuditDelta(events=events, next_seq=cursor, head_hash=last_hash, has_more=has_more)
+
+
+@app.get("/audit/stream")
+async def stream_audit_events(
+    http_request: Request,
+    since: str | None = None,
+    last_event_id: str | None = Header(default=None),
+):
+    # Hash cursors may need a scan of sealed segments, so resolve them off the event loop.
+    cursor = await run_in_threadpool(
+        resolve_since,
+        last_event_id if last_event_id and last_event_id.isdigit() else since,
+    )
+    return StreamingResponse(
+        audit_event_stream(audit_retention, audit_notifier, cursor, is_disconnected=http_request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@app.get("/audit/events/{seq}")
+def get_audit_event(seq: int):
+    try:
+        return audit_retention.get(seq)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Audit event {seq} not available") from exc
+
+
+@app.get("/audit/verify")
+def verify_audit_chain() -> ChainVerificationReport:
+    return audit_retention.verify_chain()
+
+
+@app.get("/audit/segments")
+def list_audit_segments() -> list[AuditSegment]:
+    return audit_retention.segments
+
+
+@app.post("/audit/segments/seal")
+def seal_audit_segment(request: SealRequest) -> AuditSegment | None:
+    return audit_retention.seal(request.count)
+
+
+@app.post("/audit/segments/{segment_id}/legal-hold")
+def place_legal_hold(segment_id: str, request: LegalHoldRequest):
+    try:
+        return audit_retention.place_legal_hold(segment_id, request.actor, request.reason)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown segment {segment_id}") from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/audit/segments/{segment_id}/legal-hold/release")
+def release_legal_hold(segment_id: str, request: RetentionActionRequest):
+    try:
+        return audit_retention.release_legal_hold(segment_id, request.actor)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown segment {segment_id}") from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/audit/retention/purge")
+def purge_expired_segments(request: RetentionActionRequest) -> list[AuditSegment]:
+    return audit_retention.purge_expired(request.actor)
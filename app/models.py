@@ -7,7 +7,13 @@ from enum import Enum
 from hashlib import sha256
 from typing import List
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, computed_field, model_validator
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
 class ConfidenceLevel(str, Enum):
@@ -180,6 +186,34 @@ class PacketValidationResponse(BaseModel):
     issues: List[ValidationIssue]
 
 
+class PacketState(str, Enum):
+    draft = "draft"
+    submitted = "submitted"
+    in_review = "in_review"
+    changes_requested = "changes_requested"
+    conditionally_approved = "conditionally_approved"
+    approved = "approved"
+    rejected = "rejected"
+    waived = "waived"
+
+
+class PacketStatus(BaseModel):
+    packet_id: str
+    state: PacketState
+    updated_at: datetime
+    sla_kind: str | None = None
+    sla_deadline: datetime | None = None
+
+
+class SlaEscalation(BaseModel):
+    packet_id: str
+    state: PacketState
+    kind: str
+    deadline: datetime
+    escalated_at: datetime
+    escalate_to: str
+
+
 class AuditEvent(BaseModel):
     event_id: str
     event_type: str
@@ -190,10 +224,7 @@ class AuditEvent(BaseModel):
     hash: str | None = None
 
     def compute_hash(self) -> str:
-        normalized_timestamp = self.timestamp
-        if normalized_timestamp.tzinfo is None:
-            normalized_timestamp = normalized_timestamp.replace(tzinfo=timezone.utc)
-        normalized_timestamp = normalized_timestamp.astimezone(timezone.utc)
+        normalized_timestamp = as_utc(self.timestamp)
 
         canonical_payload = json.dumps(
             self.payload,
@@ -212,3 +243,159 @@ class AuditEvent(BaseModel):
         )
         material = "|".join(str(field) for field in hash_fields)
         return sha256(material.encode("utf-8")).hexdigest()
+
+
+class SegmentBlock(BaseModel):
+    first_seq: int
+    offset: int
+    length: int
+
+
+class AuditSegment(BaseModel):
+    segment_id: str
+    codec: str
+    first_seq: int
+    last_seq: int
+    anchor_hash: str | None = None
+    head_hash: str
+    first_timestamp: datetime
+    last_timestamp: datetime
+    sealed_at: datetime
+    checksum: str
+    index: List[SegmentBlock]
+    legal_hold: bool = False
+    hold_reason: str | None = None
+    purged: bool = False
+    purged_at: datetime | None = None
+
+
+class ChainVerificationReport(BaseModel):
+    valid: bool
+    checked_events: int
+    purged_segments: int
+    head_hash: str | None = None
+    issues: List[ValidationIssue]
+
+
+class ProcedureOwner(BaseModel):
+    role: str
+    user_id: str | None = None
+
+
+class ProcedureRole(BaseModel):
+    role: str
+
+
+class ProcedureStep(BaseModel):
+    id: str
+    name: str
+    depends_on: List[str] | None = None
+    evidence_required: List[str] = Field(default_factory=list)
+    approvals_required: List[ProcedureRole] = Field(default_factory=list)
+
+
+class ProcedureException(BaseModel):
+    code: str
+    description: str
+    preconditions: List[str] = Field(default_factory=list)
+    additional_approvals: List[ProcedureRole] = Field(default_factory=list)
+    expiration_hours: float | None = Field(default=None, gt=0)
+
+
+class CapaLinkage(BaseModel):
+    trigger_conditions: List[str] = Field(default_factory=list)
+    default_capa_type: str | None = None
+
+
+# docs/qms/procedure-model.md §2.3. role_permissions (role -> gate actions) is the
+# runtime role mapping for the entry gate; a revision without it denies every action.
+class ProcedureObject(BaseModel):
+    sop_id: str
+    revision: str
+    effective_date: datetime
+    owner: ProcedureOwner
+    mandatory_steps: List[ProcedureStep]
+    role_permissions: dict[str, List[str]] = Field(default_factory=dict)
+    approval_matrix: List[str] = Field(default_factory=list)
+    signature_requirements: List[str] = Field(default_factory=list)
+    required_records: List[str] = Field(default_factory=list)
+    exceptions: List[ProcedureException] = Field(default_factory=list)
+    capa_linkage: CapaLinkage = Field(default_factory=CapaLinkage)
+
+
+class ProcedureGateRequest(BaseModel):
+    sop_id: str
+    actor: str
+    actor_role: str
+    action: str
+    step_id: str | None = None
+    completed_steps: List[str] = Field(default_factory=list)
+    evidence: List[str] = Field(default_factory=list)
+    approvals: List[str] = Field(default_factory=list)
+    signatures: List[str] = Field(default_factory=list)
+    records: List[str] = Field(default_factory=list)
+    exception_code: str | None = None
+    exception_started_at: datetime | None = None
+    conditions: List[str] = Field(default_factory=list)
+
+
+class ProcedureGateDecision(BaseModel):
+    allowed: bool
+    sop_id: str
+    revision: str | None = None
+    denial_codes: List[str]
+    issues: List[ValidationIssue]
+
+
+class RiskSeverity(str, Enum):
+    low = "low"
+    medium = "medium"
+    high = "high"
+    critical = "critical"
+
+
+class Hazard(BaseModel):
+    hazard_id: str
+    device_id: str
+    description: str
+    severity: RiskSeverity
+    hazardous_situations: List[str] = Field(default_factory=list)
+    harms: List[str] = Field(default_factory=list)
+
+
+class RiskControl(BaseModel):
+    control_id: str
+    hazard_id: str
+    description: str
+    verification_refs: List[str] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def verified(self) -> bool:
+        return bool(self.verification_refs)
+
+
+class ResidualRiskRecord(BaseModel):
+    hazard_id: str
+    residual_severity: RiskSeverity
+    acceptable: bool
+    rationale: str | None = None
+
+
+class RiskRollup(BaseModel):
+    device_id: str
+    hazards: int
+    controls: int
+    verified_controls: int
+    unverified_high_severity_controls: List[str]
+    hazards_without_controls: List[str]
+    residual_acceptable: int
+    residual_unacceptable: int
+    residual_pending: int
+
+
+class AuditDelta(BaseModel):
+    events: List[AuditEvent]
+    next_seq: int
+    head_hash: str | None = None
+    has_more: bool = False
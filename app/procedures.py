@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from datetime import datetime, timedelta, timezone
+
+from app.models import (
+    ProcedureGateDecision,
+    ProcedureGateRequest,
+    ProcedureObject,
+    ValidationIssue,
+    as_utc,
+)
+from app.services import ImmutableAuditLog
+
+COMPLETE_STEP = "complete_step"
+FINALIZE = "finalize"
+
+
+class CompiledProcedure:
+    """Decision structure derived once from an effective procedure revision.
+
+    Role permissions and step prerequisites are integer bitsets, so entry and
+    step-order gates are a couple of mask operations per call; approver,
+    signature, record and evidence requirements are frozensets.
+    """
+
+    __slots__ = (
+        "sop_id",
+        "revision",
+        "effective_date",
+        "action_bits",
+        "role_masks",
+        "step_bits",
+        "all_steps_mask",
+        "prerequisites",
+        "step_evidence",
+        "step_approvers",
+        "approvers",
+        "signers",
+        "records",
+        "exceptions",
+    )
+
+    def __init__(self, procedure: ProcedureObject) -> None:
+        self.sop_id = procedure.sop_id
+        self.revision = procedure.revision
+        self.effective_date = as_utc(procedure.effective_date)
+
+        actions = sorted({action for permitted in procedure.role_permissions.values() for action in permitted})
+        self.action_bits = {action: 1 << position for position, action in enumerate(actions)}
+        self.role_masks: dict[str, int] = {}
+        for role, permitted in procedure.role_permissions.items():
+            mask = 0
+            for action in permitted:
+                mask |= self.action_bits[action]
+            self.role_masks[role] = mask
+
+        steps = procedure.mandatory_steps
+        self.step_bits = {step.id: 1 << position for position, step in enumerate(steps)}
+        if len(self.step_bits) != len(steps):
+            raise ValueError(f"{procedure.sop_id} {procedure.revision}: duplicate step ids")
+        self.all_steps_mask = (1 << len(steps)) - 1
+        self.prerequisites = self._compile_order(procedure)
+        self.step_evidence = {step.id: frozenset(step.evidence_required) for step in steps}
+        self.step_approvers = {
+            step.id: frozenset(approval.role for approval in step.approvals_required) for step in steps
+        }
+        self.approvers = frozenset(procedure.approval_matrix)
+        self.signers = frozenset(procedure.signature_requirements)
+        self.records = frozenset(procedure.required_records)
+        self.exceptions = {
+            exception.code: (
+                frozenset(exception.preconditions),
+                frozenset(approval.role for approval in exception.additional_approvals),
+                timedelta(hours=exception.expiration_hours) if exception.expiration_hours is not None else None,
+            )
+            for exception in procedure.exceptions
+        }
+
+    def _compile_order(self, procedure: ProcedureObject) -> dict[str, int]:
+        """Return the transitive prerequisite mask of every step.
+
+        Steps without ``depends_on`` follow the previous step in the list.
+        """
+        direct: dict[str, list[str]] = {}
+        previous: str | None = None
+        for step in procedure.mandatory_steps:
+            depends_on = step.depends_on if step.depends_on is not None else ([previous] if previous else [])
+            unknown = [dependency for dependency in depends_on if dependency not in self.step_bits]
+            if unknown:
+                raise ValueError(f"{procedure.sop_id} {procedure.revision}: step {step.id} depends on unknown {unknown}")
+            direct[step.id] = depends_on
+            previous = step.id
+
+        prerequisites: dict[str, int] = {}
+        visiting: set[str] = set()
+
+        def resolve(step_id: str) -> int:
+            if step_id in prerequisites:
+                return prerequisites[step_id]
+            if step_id in visiting:
+                raise ValueError(f"{procedure.sop_id} {procedure.revision}: step order has a cycle at {step_id}")
+            visiting.add(step_id)
+            mask = 0
+            for dependency in direct[step_id]:
+                mask |= self.step_bits[dependency] | resolve(dependency)
+            visiting.discard(step_id)
+            prerequisites[step_id] = mask
+            return mask
+
+        for step_id in direct:
+            resolve(step_id)
+        return prerequisites
+
+    def evaluate(self, request: ProcedureGateRequest, at: datetime) -> list[ValidationIssue]:
+        action_bit = self.action_bits.get(request.action, 0)
+        if not action_bit & self.role_masks.get(request.actor_role, 0):
+            return [
+                ValidationIssue(
+                    code="GATE-ENTRY-ROLE-NOT-PERMITTED",
+                    message=f"Role {request.actor_role} may not perform {request.action}.",
+                )
+            ]
+
+        issues: list[ValidationIssue] = []
+        approvals = set(request.approvals)
+
+        exception_granted = False
+        if request.exception_code is not None:
+            exception = self.exceptions.get(request.exception_code)
+            if exception is None:
+                issues.append(
+                    ValidationIssue(
+                        code="GATE-EXCEPTION-UNKNOWN",
+                        message=f"Exception {request.exception_code} is not defined for this revision.",
+                    )
+                )
+            else:
+                preconditions, additional_approvals, expiration = exception
+                missing_conditions = preconditions.difference(request.conditions)
+                missing_approvals = additional_approvals - approvals
+                expiry_issue = self._exception_expiry_issue(request, expiration, at)
+                if expiry_issue is not None:
+                    issues.append(expiry_issue)
+                if missing_conditions:
+                    issues.append(
+                        ValidationIssue(
+                            code="GATE-EXCEPTION-PRECONDITION",
+                            message=f"Exception preconditions not met: {sorted(missing_conditions)}",
+                        )
+                    )
+                if missing_approvals:
+                    issues.append(
+                        ValidationIssue(
+                            code="GATE-EXCEPTION-APPROVAL-MISSING",
+                            message=f"Exception requires additional approvals: {sorted(missing_approvals)}",
+                        )
+                    )
+                exception_granted = not missing_conditions and not missing_approvals and expiry_issue is None
+
+        completed = 0
+        for step_id in request.completed_steps:
+            completed |= self.step_bits.get(step_id, 0)
+
+        if request.step_id is not None:
+            if request.step_id not in self.step_bits:
+                issues.append(
+                    ValidationIssue(code="GATE-STEP-UNKNOWN", message=f"Unknown step {request.step_id}.")
+                )
+            else:
+                outstanding = self.prerequisites[request.step_id] & ~completed
+                if outstanding and not exception_granted:
+                    issues.append(
+                        ValidationIssue(
+                            code="GATE-STEP-OUT-OF-ORDER",
+                            message=f"Prerequisite steps incomplete: {self._step_ids(outstanding)}",
+                        )
+                    )
+                if request.action == COMPLETE_STEP:
+                    missing_evidence = self.step_evidence[request.step_id].difference(request.evidence)
+                    if missing_evidence:
+                        issues.append(
+                            ValidationIssue(
+                                code="GATE-STEP-EVIDENCE-MISSING",
+                                message=f"Step {request.step_id} requires evidence: {sorted(missing_evidence)}",
+                            )
+                        )
+                    missing_approvals = self.step_approvers[request.step_id] - approvals
+                    if missing_approvals:
+                        issues.append(
+                            ValidationIssue(
+                                code="GATE-APPROVAL-MISSING",
+                                message=f"Step {request.step_id} requires approvals: {sorted(missing_approvals)}",
+                            )
+                        )
+
+        if request.action == FINALIZE:
+            outstanding = self.all_steps_mask & ~completed
+            if outstanding:
+                issues.append(
+                    ValidationIssue(
+                        code="GATE-STEP-INCOMPLETE",
+                        message=f"Mandatory steps incomplete: {self._step_ids(outstanding)}",
+                    )
+                )
+            missing_approvals = self.approvers - approvals
+            if missing_approvals:
+                issues.append(
+                    ValidationIssue(
+                        code="GATE-APPROVAL-MISSING",
+                        message=f"Missing required approvals: {sorted(missing_approvals)}",
+                    )
+                )
+            missing_signatures = self.signers.difference(request.signatures)
+            if missing_signatures:
+                issues.append(
+                    ValidationIssue(
+                        code="GATE-SIGNATURE-MISSING",
+                        message=f"Missing required signatures: {sorted(missing_signatures)}",
+                    )
+                )
+            missing_records = self.records.difference(request.records)
+            if missing_records:
+                issues.append(
+                    ValidationIssue(
+                        code="GATE-RECORD-MISSING",
+                        message=f"Missing required records: {sorted(missing_records)}",
+                    )
+                )
+
+        return issues
+
+    @staticmethod
+    def _exception_expiry_issue(
+        request: ProcedureGateRequest,
+        expiration: timedelta | None,
+        at: datetime,
+    ) -> ValidationIssue | None:
+        if expiration is None:
+            return None
+        if request.exception_started_at is None:
+            return ValidationIssue(
+                code="GATE-EXCEPTION-START-MISSING",
+                message=f"Exception {request.exception_code} is time-limited; exception_started_at is required.",
+            )
+        if at >= as_utc(request.exception_started_at) + expiration:
+            return ValidationIssue(
+                code="GATE-EXCEPTION-EXPIRED",
+                message=f"Exception {request.exception_code} expired after {expiration}.",
+            )
+        return None
+
+    def _step_ids(self, mask: int) -> list[str]:
+        return [step_id for step_id, bit in self.step_bits.items() if bit & mask]
+
+
+class ProcedureRegistry:
+    """Holds published procedure revisions and gates agent actions against them.
+
+    Each revision is compiled once on publish. The active revision per SOP is
+    cached together with the window in which it stays effective, so the cache
+    only changes when a later revision's effective date is reached.
+    """
+
+    def __init__(self, audit_log: ImmutableAuditLog) -> None:
+        self._audit_log = audit_log
+        self._revisions: dict[str, list[CompiledProcedure]] = {}
+        self._active: dict[str, tuple[CompiledProcedure, datetime | None]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, procedure: ProcedureObject, actor: str) -> CompiledProcedure:
+        compiled = CompiledProcedure(procedure)
+        with self._lock:
+            revisions = self._revisions.setdefault(procedure.sop_id, [])
+            for existing in revisions:
+                if existing.revision == compiled.revision:
+                    raise ValueError(f"{procedure.sop_id} {procedure.revision} is already published")
+                if existing.effective_date == compiled.effective_date:
+                    raise ValueError(
+                        f"{procedure.sop_id} {existing.revision} is already effective at {compiled.effective_date}"
+                    )
+            position = bisect.bisect([existing.effective_date for existing in revisions], compiled.effective_date)
+            revisions.insert(position, compiled)
+
+            cached = self._active.get(procedure.sop_id)
+            if cached is not None:
+                active, until = cached
+                if active.effective_date < compiled.effective_date and (until is None or compiled.effective_date < until):
+                    self._active[procedure.sop_id] = (active, compiled.effective_date)
+
+            self._audit_log.record_action(
+                actor,
+                "procedure_published",
+                {
+                    "sop_id": compiled.sop_id,
+                    "revision": compiled.revision,
+                    "effective_date": compiled.effective_date.isoformat(),
+                },
+            )
+        return compiled
+
+    def active(self, sop_id: str, at: datetime | None = None) -> CompiledProcedure | None:
+        at = as_utc(at) if at else datetime.now(timezone.utc)
+        cached = self._active.get(sop_id)
+        if cached is not None:
+            active, until = cached
+            if active.effective_date <= at and (until is None or at < until):
+                return active
+
+        # Recompute under the publish lock so a concurrent publish cannot be overwritten by a stale window.
+        with self._lock:
+            revisions = self._revisions.get(sop_id, [])
+            position = bisect.bisect([revision.effective_date for revision in revisions], at)
+            if position == 0:
+                return None
+            active = revisions[position - 1]
+            until = revisions[position].effective_date if position < len(revisions) else None
+            self._active[sop_id] = (active, until)
+            return active
+
+    def evaluate(self, request: ProcedureGateRequest, at: datetime | None = None) -> ProcedureGateDecision:
+        at = as_utc(at) if at else datetime.now(timezone.utc)
+        procedure = self.active(request.sop_id, at)
+        if procedure is None:
+            issues = [
+                ValidationIssue(
+                    code="GATE-ENTRY-NO-EFFECTIVE-REVISION",
+                    message=f"No effective revision of {request.sop_id}.",
+                )
+            ]
+            revision = None
+        else:
+            issues = procedure.evaluate(request, at)
+            revision = procedure.revision
+        return ProcedureGateDecision(
+            allowed=len(issues) == 0,
+            sop_id=request.sop_id,
+            revision=revision,
+            denial_codes=[issue.code for issue in issues],
+            issues=issues,
+        )
+
+    def check(self, request: ProcedureGateRequest, at: datetime | None = None) -> ProcedureGateDecision:
+        """Evaluate the gate and record the decision as an audit event."""
+        decision = self.evaluate(request, at)
+        self._audit_log.record_action(
+            request.actor,
+            "procedure_gate",
+            {
+                "sop_id": decision.sop_id,
+                "revision": decision.revision,
+                "actor_role": request.actor_role,
+                "gate_action": request.action,
+                "step_id": request.step_id,
+                "denial_codes": decision.denial_codes,
+            },
+            outcome="success" if decision.allowed else "blocked",
+        )
+        return decision
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import bisect
+import lzma
+import mmap
+import os
+import tempfile
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterator
+
+from app.models import (
+    AuditEvent,
+    AuditSegment,
+    ChainVerificationReport,
+    SegmentBlock,
+    ValidationIssue,
+    as_utc,
+)
+from app.services import ImmutableAuditLog
+
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 9), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+# docs/compliance/audit-traceability.md §5.1: minimum 10 years.
+DEFAULT_RETENTION = timedelta(days=3653)
+
+
+class AuditRetentionManager:
+    """Moves older audit events from the hot log into sealed, compressed segments.
+
+    Each segment is a read-only file of independently compressed blocks of
+    ``block_size`` events. A sparse index (first sequence number and byte range
+    per block) is kept in a JSON manifest next to it, so a historical read maps
+    the file and decompresses a single block.
+
+    Manifests already in ``storage_dir`` are loaded on start-up and the hot log
+    resumes the chain after the last sealed event. Without a ``storage_dir``,
+    segments go to a temporary directory created on the first seal.
+    """
+
+    def __init__(
+        self,
+        hot_log: ImmutableAuditLog,
+        storage_dir: Path | str | None = None,
+        codec: str = "zlib",
+        block_size: int = 64,
+        retention: timedelta = DEFAULT_RETENTION,
+    ) -> None:
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported codec: {codec}")
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self._hot = hot_log
+        self._storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self._tempdir: tempfile.TemporaryDirectory | None = None
+        self._codec = codec
+        self._block_size = block_size
+        self._retention = retention
+        self._segments: list[AuditSegment] = []
+        self._segment_starts: list[int] = []
+        self._lock = threading.Lock()
+        if self._storage_dir is not None:
+            self._load_manifests()
+
+    @property
+    def segments(self) -> list[AuditSegment]:
+        return self._segments
+
+    def seal(self, count: int | None = None) -> AuditSegment | None:
+        """Seal the oldest ``count`` hot events into a segment.
+
+        The head event always stays hot, so ``GET /audit/events`` keeps ending
+        at the chain head; by default everything before it is sealed.
+        """
+        with self._lock:
+            hot_events = self._hot.events
+            sealable = len(hot_events) - 1
+            count = sealable if count is None else min(count, sealable)
+            if count <= 0:
+                return None
+
+            events = hot_events[:count]
+            first_seq = self._hot.base_seq
+            last_seq = first_seq + count - 1
+            segment_id = f"seg-{first_seq:012d}-{last_seq:012d}"
+            compress, _ = CODECS[self._codec]
+
+            path = self._storage() / f"{segment_id}.{self._codec}"
+            digest = sha256()
+            index: list[SegmentBlock] = []
+            offset = 0
+            with path.open("xb") as fh:
+                for start in range(0, count, self._block_size):
+                    chunk = events[start : start + self._block_size]
+                    data = compress(b"\n".join(event.model_dump_json().encode("utf-8") for event in chunk))
+                    fh.write(data)
+                    digest.update(data)
+                    index.append(SegmentBlock(first_seq=first_seq + start, offset=offset, length=len(data)))
+                    offset += len(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            path.chmod(0o444)
+
+            segment = AuditSegment(
+                segment_id=segment_id,
+                codec=self._codec,
+                first_seq=first_seq,
+                last_seq=last_seq,
+                anchor_hash=events[0].previous_event_hash,
+                head_hash=events[-1].hash,
+                first_timestamp=as_utc(events[0].timestamp),
+                last_timestamp=as_utc(events[-1].timestamp),
+                sealed_at=datetime.now(timezone.utc),
+                checksum=digest.hexdigest(),
+                index=index,
+            )
+            self._write_manifest(segment)
+            # Publish the segment before dropping the hot copies so readers never see a gap.
+            self._segments.append(segment)
+            self._segment_starts.append(first_seq)
+            self._hot.release_prefix(count)
+            return segment
+
+    def get(self, seq: int) -> AuditEvent:
+        if seq < 0:
+            raise KeyError(seq)
+        base_seq, hot_events, length = self._hot.snapshot()
+        if seq >= base_seq:
+            if seq - base_seq >= length:
+                raise KeyError(seq)
+            return hot_events[seq - base_seq]
+
+        segment = self._segment_for(seq)
+        if segment.purged:
+            raise KeyError(seq)
+        block_position = bisect.bisect_right([block.first_seq for block in segment.index], seq) - 1
+        block = segment.index[block_position]
+        try:
+            events = self._read_block(segment, block)
+        except OSError as exc:
+            raise KeyError(seq) from exc
+        return events[seq - block.first_seq]
+
+    def iter_events(self, start: int = 0) -> Iterator[tuple[int, AuditEvent]]:
+        """Yield ``(seq, event)`` from ``start`` onwards across cold and hot storage, skipping purged ranges."""
+        base_seq, hot_events, length = self._hot.snapshot()
+        for segment in list(self._segments):
+            if segment.first_seq >= base_seq:
+                break
+            if segment.last_seq < start or segment.purged:
+                continue
+            block_ends = [block.first_seq for block in segment.index[1:]] + [segment.last_seq + 1]
+            for block, block_end in zip(segment.index, block_ends):
+                if block_end <= start:
+                    continue
+                for offset, event in enumerate(self._read_block(segment, block)):
+                    seq = block.first_seq + offset
+                    if seq >= start:
+                        yield seq, event
+
+        for seq in range(max(start, base_seq), base_seq + length):
+            yield seq, hot_events[seq - base_seq]
+
+    def seq_for_hash(self, event_hash: str) -> int:
+        """Locate an event by hash, scanning back from the head so recent cursors resolve quickly."""
+        base_seq, hot_events, length = self._hot.snapshot()
+        for position in range(length - 1, -1, -1):
+            if hot_events[position].hash == event_hash:
+                return base_seq + position
+
+        for segment in reversed(self._segments):
+            if segment.head_hash == event_hash:
+                return segment.last_seq
+        for seq, event in self.iter_events():
+            if seq >= base_seq:
+                break
+            if event.hash == event_hash:
+                return seq
+        raise KeyError(event_hash)
+
+    def place_legal_hold(self, segment_id: str, actor: str, reason: str) -> AuditSegment:
+        with self._lock:
+            segment = self._require(segment_id)
+            if segment.purged:
+                raise ValueError(f"Segment {segment_id} has already been purged")
+            segment.legal_hold = True
+            segment.hold_reason = reason
+            self._write_manifest(segment)
+            self._hot.record_action(actor, "legal_hold_placed", {"segment_id": segment_id, "reason": reason})
+            return segment
+
+    def release_legal_hold(self, segment_id: str, actor: str) -> AuditSegment:
+        with self._lock:
+            segment = self._require(segment_id)
+            if not segment.legal_hold:
+                raise ValueError(f"Segment {segment_id} is not under legal hold")
+            segment.legal_hold = False
+            segment.hold_reason = None
+            self._write_manifest(segment)
+            self._hot.record_action(actor, "legal_hold_released", {"segment_id": segment_id})
+            return segment
+
+    def purge_expired(self, actor: str, now: datetime | None = None) -> list[AuditSegment]:
+        """Delete segment files past the retention period. Held segments are never purged.
+
+        Manifests are kept so the chain can still be verified across purged ranges.
+        """
+        cutoff = as_utc(now or datetime.now(timezone.utc)) - self._retention
+        purged: list[AuditSegment] = []
+        with self._lock:
+            for segment in self._segments:
+                if segment.purged or segment.legal_hold or segment.last_timestamp > cutoff:
+                    continue
+                self._segment_path(segment).unlink(missing_ok=True)
+                segment.purged = True
+                segment.purged_at = datetime.now(timezone.utc)
+                self._write_manifest(segment)
+                purged.append(segment)
+            if purged:
+                self._hot.record_action(
+                    actor,
+                    "retention_purge",
+                    {"segment_ids": [segment.segment_id for segment in purged]},
+                )
+        return purged
+
+    def verify_chain(self) -> ChainVerificationReport:
+        issues: list[ValidationIssue] = []
+        checked = 0
+        purged_segments = 0
+        expected_previous: str | None = None
+        # Snapshot the hot tail first: seal() publishes a segment before releasing its events,
+        # so every seq below base_seq is already covered by the segment list read next.
+        base_seq, hot_events, length = self._hot.snapshot()
+
+        for segment in list(self._segments):
+            if segment.first_seq >= base_seq:
+                break
+            if segment.anchor_hash != expected_previous:
+                issues.append(
+                    ValidationIssue(
+                        code="CHAIN-SEGMENT-BOUNDARY",
+                        message=f"Segment {segment.segment_id} does not link to the preceding chain head.",
+                    )
+                )
+            expected_previous = segment.head_hash
+            if segment.purged:
+                purged_segments += 1
+                continue
+
+            try:
+                view = self._open(segment)
+            except OSError:
+                issues.append(
+                    ValidationIssue(
+                        code="CHAIN-SEGMENT-MISSING",
+                        message=f"Segment {segment.segment_id} file is missing or unreadable.",
+                    )
+                )
+                continue
+            with view:
+                if sha256(view).hexdigest() != segment.checksum:
+                    issues.append(
+                        ValidationIssue(
+                            code="CHAIN-SEGMENT-CHECKSUM",
+                            message=f"Segment {segment.segment_id} checksum mismatch.",
+                        )
+                    )
+                    continue
+                previous = segment.anchor_hash
+                for block in segment.index:
+                    for offset, event in enumerate(self._decode_block(segment, block, view)):
+                        issues.extend(self._check_event(block.first_seq + offset, event, previous))
+                        previous = event.hash
+                        checked += 1
+            if previous != segment.head_hash:
+                issues.append(
+                    ValidationIssue(
+                        code="CHAIN-SEGMENT-HEAD",
+                        message=f"Segment {segment.segment_id} head hash does not match its last event.",
+                    )
+                )
+
+        previous = expected_previous
+        for offset, event in enumerate(hot_events[:length]):
+            issues.extend(self._check_event(base_seq + offset, event, previous))
+            previous = event.hash
+            checked += 1
+
+        return ChainVerificationReport(
+            valid=len(issues) == 0,
+            checked_events=checked,
+            purged_segments=purged_segments,
+            head_hash=previous,
+            issues=issues,
+        )
+
+    @staticmethod
+    def _check_event(seq: int, event: AuditEvent, previous: str | None) -> list[ValidationIssue]:
+        issues: list[ValidationIssue] = []
+        if event.previous_event_hash != previous:
+            issues.append(
+                ValidationIssue(
+                    code="CHAIN-LINK-BROKEN",
+                    message=f"Event {event.event_id} (seq {seq}) does not link to its predecessor.",
+                )
+            )
+        if event.compute_hash() != event.hash:
+            issues.append(
+                ValidationIssue(
+                    code="CHAIN-HASH-MISMATCH",
+                    message=f"Event {event.event_id} (seq {seq}) hash does not match its content.",
+                )
+            )
+        return issues
+
+    def _require(self, segment_id: str) -> AuditSegment:
+        for segment in self._segments:
+            if segment.segment_id == segment_id:
+                return segment
+        raise KeyError(segment_id)
+
+    def _segment_for(self, seq: int) -> AuditSegment:
+        position = bisect.bisect_right(self._segment_starts, seq) - 1
+        if position < 0:
+            raise KeyError(seq)
+        return self._segments[position]
+
+    def _storage(self) -> Path:
+        if self._storage_dir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="audit-segments-")
+            self._storage_dir = Path(self._tempdir.name)
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        return self._storage_dir
+
+    def _load_manifests(self) -> None:
+        if not self._storage_dir.is_dir():
+            return
+        segments = sorted(
+            (
+                AuditSegment.model_validate_json(manifest.read_text(encoding="utf-8"))
+                for manifest in self._storage_dir.glob("seg-*.json")
+            ),
+            key=lambda segment: segment.first_seq,
+        )
+        manifested = {segment.segment_id for segment in segments}
+        orphaned = sorted(
+            path.name
+            for path in self._storage_dir.glob("seg-*")
+            if path.suffix != ".json" and path.stem not in manifested
+        )
+        if orphaned:
+            raise ValueError(f"Segment files without a manifest in {self._storage_dir}: {orphaned}")
+        missing = [
+            segment.segment_id
+            for segment in segments
+            if not segment.purged and not (self._storage_dir / f"{segment.segment_id}.{segment.codec}").is_file()
+        ]
+        if missing:
+            raise ValueError(f"Unpurged segments without a segment file in {self._storage_dir}: {missing}")
+        if not segments:
+            return
+
+        expected_seq = 0
+        for segment in segments:
+            if segment.first_seq != expected_seq:
+                raise ValueError(
+                    f"Segment manifests in {self._storage_dir} are not contiguous: "
+                    f"expected seq {expected_seq}, found {segment.segment_id}"
+                )
+            expected_seq = segment.last_seq + 1
+        self._hot.resume(expected_seq, segments[-1].head_hash)
+        self._segments = segments
+        self._segment_starts = [segment.first_seq for segment in segments]
+
+    def _segment_path(self, segment: AuditSegment) -> Path:
+        return self._storage() / f"{segment.segment_id}.{segment.codec}"
+
+    def _write_manifest(self, segment: AuditSegment) -> None:
+        manifest = self._storage() / f"{segment.segment_id}.json"
+        manifest.write_text(segment.model_dump_json(indent=2), encoding="utf-8")
+
+    def _open(self, segment: AuditSegment) -> mmap.mmap:
+        with self._segment_path(segment).open("rb") as fh:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_block(self, segment: AuditSegment, block: SegmentBlock) -> list[AuditEvent]:
+        with self._open(segment) as view:
+            return self._decode_block(segment, block, view)
+
+    @staticmethod
+    def _decode_block(segment: AuditSegment, block: SegmentBlock, view: mmap.mmap) -> list[AuditEvent]:
+        _, decompress = CODECS[segment.codec]
+        raw = decompress(view[block.offset : block.offset + block.length])
+        return [AuditEvent.model_validate_json(line) for line in raw.split(b"\n")]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter, defaultdict
+
+from app.models import (
+    HandoffPacket,
+    Hazard,
+    ResidualRiskRecord,
+    RiskControl,
+    RiskRollup,
+    RiskSeverity,
+)
+from app.services import ImmutableAuditLog
+
+HIGH_SEVERITIES = frozenset({RiskSeverity.high, RiskSeverity.critical})
+
+
+class RiskRegister:
+    """ISO 14971 hazard → control → verification register with incremental rollups.
+
+    Every mutation updates the per-device indexes in place, so rollups and
+    "unverified controls by severity" queries read the indexes instead of
+    rescanning hazards, controls or packets.
+    """
+
+    def __init__(self, audit_log: ImmutableAuditLog) -> None:
+        self._audit_log = audit_log
+        self._hazards: dict[str, Hazard] = {}
+        self._controls: dict[str, RiskControl] = {}
+        self._residuals: dict[str, ResidualRiskRecord] = {}
+        self._hazards_by_device: dict[str, set[str]] = defaultdict(set)
+        self._controls_by_hazard: dict[str, set[str]] = defaultdict(set)
+        self._controls_by_verification: dict[str, set[str]] = defaultdict(set)
+        self._uncontrolled: dict[str, set[str]] = defaultdict(set)
+        self._unverified: dict[tuple[str, RiskSeverity], set[str]] = defaultdict(set)
+        self._control_counts: Counter[str] = Counter()
+        self._verified_counts: Counter[str] = Counter()
+        self._residual_counts: dict[str, Counter[bool]] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def hazard(self, hazard_id: str) -> Hazard:
+        return self._hazards[hazard_id]
+
+    def control(self, control_id: str) -> RiskControl:
+        return self._controls[control_id]
+
+    def add_hazard(self, hazard: Hazard, actor: str) -> Hazard:
+        with self._lock:
+            if hazard.hazard_id in self._hazards:
+                raise ValueError(f"Hazard {hazard.hazard_id} is already registered")
+            self._index_hazard(hazard)
+            self._audit_log.record_action(
+                actor,
+                "hazard_registered",
+                {"hazard_id": hazard.hazard_id, "device_id": hazard.device_id, "severity": hazard.severity.value},
+            )
+            return hazard
+
+    def add_control(self, control: RiskControl, actor: str) -> RiskControl:
+        with self._lock:
+            if control.hazard_id not in self._hazards:
+                raise KeyError(control.hazard_id)
+            if control.control_id in self._controls:
+                raise ValueError(f"Control {control.control_id} is already registered")
+            self._index_control(control)
+            self._audit_log.record_action(
+                actor,
+                "risk_control_registered",
+                {"control_id": control.control_id, "hazard_id": control.hazard_id},
+            )
+            return control
+
+    def verify_control(self, control_id: str, verification_id: str, actor: str) -> RiskControl:
+        with self._lock:
+            control = self._controls[control_id]
+            if verification_id in control.verification_refs:
+                return control
+            self._add_verification(control, verification_id)
+            self._audit_log.record_action(
+                actor,
+                "risk_control_verified",
+                {"control_id": control_id, "verification_id": verification_id},
+            )
+            return control
+
+    def record_residual(self, record: ResidualRiskRecord, actor: str) -> ResidualRiskRecord:
+        if record.acceptable and not record.rationale:
+            raise ValueError("Residual risk cannot be accepted without rationale")
+        with self._lock:
+            hazard = self._hazards[record.hazard_id]
+            previous = self._residuals.get(record.hazard_id)
+            counts = self._residual_counts[hazard.device_id]
+            if previous is not None:
+                counts[previous.acceptable] -= 1
+            counts[record.acceptable] += 1
+            self._residuals[record.hazard_id] = record
+            self._audit_log.record_action(
+                actor,
+                "residual_risk_evaluated",
+                {
+                    "hazard_id": record.hazard_id,
+                    "residual_severity": record.residual_severity.value,
+                    "acceptable": record.acceptable,
+                },
+            )
+            return record
+
+    def ingest_packet(self, device_id: str, packet: HandoffPacket, actor: str) -> list[RiskControl]:
+        """Register the ``risk_controls`` links of a handoff packet.
+
+        Unknown risks become hazards at the linked severity. A link marked
+        verified records the packet itself as the verification source; the
+        packet's evidence index is not spread across its controls. Links that
+        contradict registered hazards or controls are rejected before anything
+        is indexed.
+        """
+        known = {severity.value for severity in RiskSeverity}
+        unknown_severities = sorted({link.severity for link in packet.risk_controls if link.severity.lower() not in known})
+        if unknown_severities:
+            raise ValueError(f"Unknown risk severities: {unknown_severities}")
+
+        touched: list[RiskControl] = []
+        with self._lock:
+            self._check_packet_links(device_id, packet)
+            for link in packet.risk_controls:
+                if link.risk_id not in self._hazards:
+                    self._index_hazard(
+                        Hazard(
+                            hazard_id=link.risk_id,
+                            device_id=device_id,
+                            description=f"Registered from packet {packet.packet_id}",
+                            severity=RiskSeverity(link.severity.lower()),
+                        )
+                    )
+                control = self._controls.get(link.control_id)
+                if control is None:
+                    control = RiskControl(
+                        control_id=link.control_id,
+                        hazard_id=link.risk_id,
+                        description=f"Registered from packet {packet.packet_id}",
+                    )
+                    self._index_control(control)
+                if link.verified and packet.packet_id not in control.verification_refs:
+                    self._add_verification(control, packet.packet_id)
+                touched.append(control)
+            self._audit_log.record_action(
+                actor,
+                "risk_packet_ingested",
+                {
+                    "packet_id": packet.packet_id,
+                    "device_id": device_id,
+                    "control_ids": [control.control_id for control in touched],
+                },
+            )
+        return touched
+
+    def unverified_controls(
+        self,
+        device_id: str,
+        severities: frozenset[RiskSeverity] | set[RiskSeverity] = HIGH_SEVERITIES,
+    ) -> list[RiskControl]:
+        control_ids = set().union(*(self._unverified.get((device_id, severity), set()) for severity in severities))
+        return [self._controls[control_id] for control_id in sorted(control_ids)]
+
+    def controls_for_hazard(self, hazard_id: str) -> list[RiskControl]:
+        return [self._controls[control_id] for control_id in sorted(self._controls_by_hazard.get(hazard_id, ()))]
+
+    def controls_for_verification(self, verification_id: str) -> list[RiskControl]:
+        return [self._controls[control_id] for control_id in sorted(self._controls_by_verification.get(verification_id, ()))]
+
+    def rollup(self, device_id: str) -> RiskRollup:
+        hazards = len(self._hazards_by_device.get(device_id, ()))
+        residual_counts = self._residual_counts.get(device_id, Counter())
+        return RiskRollup(
+            device_id=device_id,
+            hazards=hazards,
+            controls=self._control_counts[device_id],
+            verified_controls=self._verified_counts[device_id],
+            unverified_high_severity_controls=[
+                control.control_id for control in self.unverified_controls(device_id)
+            ],
+            hazards_without_controls=sorted(self._uncontrolled.get(device_id, ())),
+            residual_acceptable=residual_counts[True],
+            residual_unacceptable=residual_counts[False],
+            residual_pending=hazards - residual_counts[True] - residual_counts[False],
+        )
+
+    def _check_packet_links(self, device_id: str, packet: HandoffPacket) -> None:
+        # Only links added earlier in this packet are tracked here; registered records are looked up directly.
+        pending_hazards: dict[str, tuple[str, RiskSeverity]] = {}
+        pending_controls: dict[str, str] = {}
+        for link in packet.risk_controls:
+            severity = RiskSeverity(link.severity.lower())
+            registered = self._hazards.get(link.risk_id)
+            if registered is not None:
+                hazard = (registered.device_id, registered.severity)
+            else:
+                hazard = pending_hazards.setdefault(link.risk_id, (device_id, severity))
+            if hazard[0] != device_id:
+                raise ValueError(f"Risk {link.risk_id} belongs to device {hazard[0]}, not {device_id}")
+            if hazard[1] != severity:
+                raise ValueError(
+                    f"Risk {link.risk_id} is registered at severity {hazard[1].value}, packet links {severity.value}"
+                )
+            control = self._controls.get(link.control_id)
+            if control is not None:
+                hazard_id = control.hazard_id
+            else:
+                hazard_id = pending_controls.setdefault(link.control_id, link.risk_id)
+            if hazard_id != link.risk_id:
+                raise ValueError(f"Control {link.control_id} already controls {hazard_id}, packet links {link.risk_id}")
+
+    def _index_hazard(self, hazard: Hazard) -> None:
+        self._hazards[hazard.hazard_id] = hazard
+        self._hazards_by_device[hazard.device_id].add(hazard.hazard_id)
+        self._uncontrolled[hazard.device_id].add(hazard.hazard_id)
+
+    def _index_control(self, control: RiskControl) -> None:
+        hazard = self._hazards[control.hazard_id]
+        self._controls[control.control_id] = control
+        self._controls_by_hazard[hazard.hazard_id].add(control.control_id)
+        self._uncontrolled[hazard.device_id].discard(hazard.hazard_id)
+        self._control_counts[hazard.device_id] += 1
+        if control.verified:
+            self._verified_counts[hazard.device_id] += 1
+            for verification_id in control.verification_refs:
+                self._controls_by_verification[verification_id].add(control.control_id)
+        else:
+            self._unverified[(hazard.device_id, hazard.severity)].add(control.control_id)
+
+    def _add_verification(self, control: RiskControl, verification_id: str) -> None:
+        hazard = self._hazards[control.hazard_id]
+        if not control.verified:
+            self._unverified[(hazard.device_id, hazard.severity)].discard(control.control_id)
+            self._verified_counts[hazard.device_id] += 1
+        control.verification_refs.append(verification_id)
+        self._controls_by_verification[verification_id].add(control.control_id)
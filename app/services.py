@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 from collections import Counter
-from typing import Iterable
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+from uuid import uuid4
 
 from app.models import (
     INTENDED_USE_REQUIRED_KEYS,
@@ -238,16 +241,85 @@ class PacketValidator:
 class ImmutableAuditLog:
     def __init__(self) -> None:
         self._events: list[AuditEvent] = []
+        self._base_seq = 0
+        self._head_hash: str | None = None
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[AuditEvent], None]] = []
 
     @property
     def events(self) -> list[AuditEvent]:
         return self._events
 
+    @property
+    def base_seq(self) -> int:
+        """Sequence number of the oldest event still held in memory."""
+        return self._base_seq
+
+    @property
+    def head_hash(self) -> str | None:
+        return self._head_hash
+
+    @property
+    def cursor(self) -> tuple[int, str | None]:
+        """Consistent ``(next_seq, head_hash)`` snapshot of the chain head."""
+        with self._lock:
+            return self._base_seq + len(self._events), self._head_hash
+
+    def snapshot(self) -> tuple[int, list[AuditEvent], int]:
+        """Return ``(base_seq, events, length)`` without copying.
+
+        ``release_prefix`` swaps in a new list rather than shrinking this one,
+        so the first ``length`` entries of ``events`` stay valid for ``base_seq``.
+        """
+        with self._lock:
+            return self._base_seq, self._events, len(self._events)
+
+    def resume(self, base_seq: int, head_hash: str | None) -> None:
+        """Continue an archived chain: the next event gets ``base_seq`` and links to ``head_hash``."""
+        with self._lock:
+            if self._events or self._base_seq or self._head_hash is not None:
+                raise ValueError("Audit log already holds events; it cannot resume an archived chain")
+            self._base_seq = base_seq
+            self._head_hash = head_hash
+
+    def add_listener(self, listener: Callable[[AuditEvent], None]) -> None:
+        """Register a callback invoked after every append; it must not block."""
+        self._listeners.append(listener)
+
     def append(self, event: AuditEvent) -> AuditEvent:
-        previous_hash = self._events[-1].hash if self._events else None
-        if event.previous_event_hash != previous_hash:
-            raise ValueError("previous_event_hash mismatch")
+        with self._lock:
+            if event.previous_event_hash != self._head_hash:
+                raise ValueError("previous_event_hash mismatch")
+            return self._link(event)
+
+    def record_action(self, actor: str, action: str, details: dict, outcome: str = "success") -> AuditEvent:
+        """Append a system-generated role_action event linked to the current head."""
+        with self._lock:
+            event = AuditEvent(
+                event_id=f"EVT-{uuid4().hex}",
+                event_type="role_action",
+                actor=actor,
+                timestamp=datetime.now(timezone.utc),
+                payload={"action": action, "outcome": outcome, **details},
+                previous_event_hash=self._head_hash,
+            )
+            return self._link(event)
 
+    def _link(self, event: AuditEvent) -> AuditEvent:
         event.hash = event.compute_hash()
         self._events.append(event)
+        self._head_hash = event.hash
+        for listener in self._listeners:
+            listener(event)
         return event
+
+    def release_prefix(self, count: int) -> list[AuditEvent]:
+        """Drop the oldest ``count`` events once they are durably stored elsewhere.
+
+        The chain head is untouched, so appends keep linking to the latest event.
+        """
+        with self._lock:
+            released = self._events[:count]
+            self._events = self._events[count:]
+            self._base_seq += len(released)
+            return released
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from hashlib import sha256
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from pydantic import BaseModel
+
+from app.models import AuditEvent
+from app.retention import AuditRetentionManager
+
+PACKET_STATUS_ACTIONS = {"packet_registered", "packet_transition"}
+
+
+def chain_etag(next_seq: int, head_hash: str | None, base_seq: int | None = None) -> str:
+    prefix = f"{base_seq}:" if base_seq is not None else ""
+    return f'"{prefix}{next_seq}-{head_hash or "genesis"}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str, allow_wildcard: bool = True) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return (allow_wildcard and "*" in candidates) or etag in candidates
+
+
+class ValidationCache:
+    """Bounded LRU of validation results keyed by a digest of the request body.
+
+    The digest doubles as the response ETag. It identifies the request body
+    (and API version), not the result: validation is a pure function of the
+    body, so a client re-posting the same body with that ETag already holds
+    the result and is answered with 412. A changed-but-seen body skips
+    re-validation.
+    """
+
+    def __init__(self, version: str, maxsize: int = 1024) -> None:
+        self._version = version
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, kind: str, payload: BaseModel) -> str:
+        material = f"{self._version}|{kind}|{payload.model_dump_json()}"
+        return sha256(material.encode("utf-8")).hexdigest()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+
+class AuditNotifier:
+    """Wakes asyncio subscribers (SSE streams) when the audit log grows.
+
+    Appends happen on worker threads, so each subscriber's event is set via
+    its own loop's ``call_soon_threadsafe``.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: AuditEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for token, (loop, changed) in subscribers:
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                with self._lock:
+                    self._subscribers.pop(token, None)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Event]:
+        changed = asyncio.Event()
+        token = id(changed)
+        with self._lock:
+            self._subscribers[token] = (asyncio.get_running_loop(), changed)
+        try:
+            yield changed
+        finally:
+            with self._lock:
+                self._subscribers.pop(token, None)
+
+
+def read_events(retention: AuditRetentionManager, start: int, limit: int) -> list[tuple[int, AuditEvent]]:
+    """Up to ``limit`` events from ``start``; blocking (mmap + decompression), so async callers run it in a thread."""
+    return list(islice(retention.iter_events(start), limit))
+
+
+def format_sse(event: str, data: str, event_id: str | None = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+def event_frames(seq: int, event: AuditEvent) -> list[str]:
+    """SSE frames for one audit event, plus a packet_status frame for successful packet transitions."""
+    frames = [format_sse("audit", event.model_dump_json(), event_id=str(seq))]
+    payload = event.payload
+    if payload.get("action") in PACKET_STATUS_ACTIONS and payload.get("outcome") == "success":
+        status = {"seq": seq, "packet_id": payload.get("packet_id"), "state": payload.get("to_state")}
+        frames.append(format_sse("packet_status", json.dumps(status)))
+    return frames
+
+
+async def audit_event_stream(
+    retention: AuditRetentionManager,
+    notifier: AuditNotifier,
+    cursor: int,
+    heartbeat: float = 15.0,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+    page_size: int = 256,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for every audit event from ``cursor`` onwards, then wait for appends.
+
+    Events are read in pages on a worker thread so replaying sealed segments
+    never blocks the event loop.
+    """
+    with notifier.subscribe() as changed:
+        while is_disconnected is None or not await is_disconnected():
+            changed.clear()
+            while True:
+                page = await asyncio.to_thread(read_events, retention, cursor, page_size)
+                for seq, event in page:
+                    for frame in event_frames(seq, event):
+                        yield frame
+                    cursor = seq + 1
+                if len(page) < page_size:
+                    break
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+from datetime import datetime, timedelta, timezone
+
+from app.models import (
+    HandoffPacket,
+    PacketState,
+    PacketStatus,
+    SlaEscalation,
+    ValidationIssue,
+)
+from app.services import ImmutableAuditLog, PacketValidator
+
+# docs/agents/workflow-contracts.md §5
+PACKET_TRANSITIONS: dict[PacketState, set[PacketState]] = {
+    PacketState.draft: {PacketState.submitted},
+    PacketState.submitted: {PacketState.in_review, PacketState.rejected},
+    PacketState.in_review: {
+        PacketState.changes_requested,
+        PacketState.conditionally_approved,
+        PacketState.approved,
+        PacketState.rejected,
+        PacketState.waived,
+    },
+    PacketState.changes_requested: {PacketState.submitted, PacketState.rejected},
+    PacketState.conditionally_approved: {PacketState.approved, PacketState.changes_requested},
+}
+
+# docs/agents/workflow-contracts.md §6: SLA kind and escalation target per waiting state.
+SLA_RULES: dict[PacketState, tuple[str, str]] = {
+    PacketState.submitted: ("review_start", "Team Leader"),
+    PacketState.changes_requested: ("rework", "Governance Forum"),
+}
+
+COMMENT_REQUIRED_STATES = {
+    PacketState.changes_requested,
+    PacketState.conditionally_approved,
+    PacketState.rejected,
+    PacketState.waived,
+}
+
+
+class PacketTransitionError(ValueError):
+    def __init__(self, message: str, issues: list[ValidationIssue]) -> None:
+        super().__init__(message)
+        self.issues = issues
+
+
+class SlaScheduler:
+    """Min-heap of deadlines keyed by packet, with lazy cancellation.
+
+    Rescheduling or cancelling only replaces the live entry in ``_active``; stale
+    heap entries are dropped when they surface, so ``pop_expired`` costs
+    O(k log n) for k expired deadlines instead of a scan over every open packet.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._active: dict[str, tuple[datetime, int, str]] = {}
+        self._tokens = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def schedule(self, key: str, kind: str, deadline: datetime) -> None:
+        token = next(self._tokens)
+        self._active[key] = (deadline, token, kind)
+        heapq.heappush(self._heap, (deadline, token, key))
+        if len(self._heap) > 2 * len(self._active) + 64:
+            self._compact()
+
+    def cancel(self, key: str) -> None:
+        self._active.pop(key, None)
+
+    def pop_expired(self, now: datetime) -> list[tuple[str, str, datetime]]:
+        """Remove and return ``(key, kind, deadline)`` for every deadline at or before ``now``."""
+        expired: list[tuple[str, str, datetime]] = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, token, key = heapq.heappop(self._heap)
+            entry = self._active.get(key)
+            if entry is None or entry[1] != token:
+                continue
+            del self._active[key]
+            expired.append((key, entry[2], deadline))
+        return expired
+
+    def _compact(self) -> None:
+        self._heap = [(deadline, token, key) for key, (deadline, token, _) in self._active.items()]
+        heapq.heapify(self._heap)
+
+
+class PacketLifecycleService:
+    """Stateful packet review workflow built on ``HandoffPacket`` snapshots.
+
+    Every accepted or blocked transition and every SLA escalation is recorded
+    as a role_action event on the shared audit log.
+    """
+
+    def __init__(
+        self,
+        audit_log: ImmutableAuditLog,
+        review_sla: timedelta = timedelta(hours=48),
+        rework_sla: timedelta = timedelta(days=5),
+    ) -> None:
+        self._audit_log = audit_log
+        self._sla_windows = {
+            PacketState.submitted: review_sla,
+            PacketState.changes_requested: rework_sla,
+        }
+        self._scheduler = SlaScheduler()
+        self._packets: dict[str, HandoffPacket] = {}
+        self._statuses: dict[str, PacketStatus] = {}
+        self._escalations: dict[str, SlaEscalation] = {}
+        self._lock = threading.Lock()
+
+    def register(self, packet: HandoffPacket, actor: str, now: datetime | None = None) -> PacketStatus:
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            if packet.packet_id in self._statuses:
+                raise ValueError(f"Packet {packet.packet_id} is already registered")
+            status = PacketStatus(packet_id=packet.packet_id, state=PacketState.draft, updated_at=now)
+            self._packets[packet.packet_id] = packet
+            self._statuses[packet.packet_id] = status
+            self._audit_log.record_action(
+                actor,
+                "packet_registered",
+                {"packet_id": packet.packet_id, "to_state": PacketState.draft.value},
+            )
+            return status
+
+    def status(self, packet_id: str) -> PacketStatus:
+        return self._statuses[packet_id]
+
+    def packet(self, packet_id: str) -> HandoffPacket:
+        return self._packets[packet_id]
+
+    def transition(
+        self,
+        packet_id: str,
+        to_state: PacketState,
+        actor: str,
+        comment: str | None = None,
+        packet: HandoffPacket | None = None,
+        now: datetime | None = None,
+    ) -> PacketStatus:
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            current = self._statuses[packet_id]
+            candidate = packet or self._packets[packet_id]
+            issues = self._gate_issues(packet_id, current.state, to_state, candidate, comment)
+            details = {
+                "packet_id": packet_id,
+                "from_state": current.state.value,
+                "to_state": to_state.value,
+                "comment": comment,
+            }
+            if issues:
+                self._audit_log.record_action(
+                    actor,
+                    "packet_transition",
+                    {**details, "reason_codes": [issue.code for issue in issues]},
+                    outcome="blocked",
+                )
+                raise PacketTransitionError(
+                    f"Transition {current.state.value} -> {to_state.value} denied for packet {packet_id}",
+                    issues,
+                )
+
+            self._scheduler.cancel(packet_id)
+            self._escalations.pop(packet_id, None)
+            status = PacketStatus(packet_id=packet_id, state=to_state, updated_at=now)
+            if to_state in SLA_RULES:
+                status.sla_kind = SLA_RULES[to_state][0]
+                status.sla_deadline = now + self._sla_windows[to_state]
+                self._scheduler.schedule(packet_id, status.sla_kind, status.sla_deadline)
+
+            self._packets[packet_id] = candidate
+            self._statuses[packet_id] = status
+            self._audit_log.record_action(actor, "packet_transition", details)
+            return status
+
+    def escalations(self) -> list[SlaEscalation]:
+        """Open escalations, oldest deadline first. Read-only; ``escalate_overdue`` raises them."""
+        with self._lock:
+            return sorted(self._escalations.values(), key=lambda escalation: escalation.deadline)
+
+    def escalate_overdue(self, now: datetime | None = None) -> list[SlaEscalation]:
+        """Escalate packets whose SLA deadline passed by ``now`` and return the new escalations.
+
+        ``deadline`` carries the breach time; ``escalated_at`` is when the
+        escalation was raised and matches its audit event timestamp.
+        """
+        now = now or datetime.now(timezone.utc)
+        raised: list[SlaEscalation] = []
+        with self._lock:
+            for packet_id, kind, deadline in self._scheduler.pop_expired(now):
+                state = self._statuses[packet_id].state
+                escalate_to = SLA_RULES[state][1]
+                event = self._audit_log.record_action(
+                    "sla-scheduler",
+                    "sla_escalation",
+                    {
+                        "packet_id": packet_id,
+                        "state": state.value,
+                        "kind": kind,
+                        "deadline": deadline.isoformat(),
+                        "escalate_to": escalate_to,
+                    },
+                )
+                escalation = SlaEscalation(
+                    packet_id=packet_id,
+                    state=state,
+                    kind=kind,
+                    deadline=deadline,
+                    escalated_at=event.timestamp,
+                    escalate_to=escalate_to,
+                )
+                self._escalations[packet_id] = escalation
+                raised.append(escalation)
+        return raised
+
+    @staticmethod
+    def _gate_issues(
+        packet_id: str,
+        from_state: PacketState,
+        to_state: PacketState,
+        packet: HandoffPacket,
+        comment: str | None,
+    ) -> list[ValidationIssue]:
+        if to_state not in PACKET_TRANSITIONS.get(from_state, set()):
+            return [
+                ValidationIssue(
+                    code="TRANSITION-NOT-PERMITTED",
+                    message=f"Packets cannot move from {from_state.value} to {to_state.value}.",
+                )
+            ]
+
+        issues: list[ValidationIssue] = []
+        if packet.packet_id != packet_id:
+            issues.append(
+                ValidationIssue(
+                    code="TRANSITION-PACKET-ID-MISMATCH",
+                    message=f"Updated packet {packet.packet_id} does not match {packet_id}.",
+                )
+            )
+
+        if to_state in COMMENT_REQUIRED_STATES and not comment:
+            issues.append(
+                ValidationIssue(
+                    code="TRANSITION-COMMENT-REQUIRED",
+                    message=f"Moving to {to_state.value} requires a documented rationale or conditions.",
+                )
+            )
+
+        if to_state == PacketState.submitted:
+            if not packet.evidence_index:
+                issues.append(
+                    ValidationIssue(
+                        code="TRANSITION-SUBMIT-EVIDENCE-INDEX",
+                        message="Evidence index must be populated before submission.",
+                    )
+                )
+            if not packet.required_approvers:
+                issues.append(
+                    ValidationIssue(
+                        code="TRANSITION-SUBMIT-APPROVERS",
+                        message="Required approvers must be assigned before submission.",
+                    )
+                )
+        elif to_state == PacketState.approved:
+            issues.extend(PacketValidator.validate(packet).issues)
+        elif to_state == PacketState.conditionally_approved:
+            issues.extend(
+                issue
+                for issue in PacketValidator.validate(packet).issues
+                if issue.code == "PACKET-REQUIRED-APPROVALS"
+            )
+        elif to_state == PacketState.waived and not packet.approved_exception:
+            issues.append(
+                ValidationIssue(
+                    code="TRANSITION-WAIVER-EXCEPTION",
+                    message="Waiver requires a formally approved exception.",
+                )
+            )
+
+        return issues
+
+
+async def run_sla_escalations(service: PacketLifecycleService, interval: float = 60.0) -> None:
+    """Background driver: escalate overdue packets every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.to_thread(service.escalate_overdue)
+        await asyncio.sleep(interval)
@@ -141,23 +141,78 @@ export interface AuditEvent {
   hash?: string | null;
 }
 
+export interface AuditDelta {
+  events: AuditEvent[];
+  next_seq: number;
+  head_hash?: string | null;
+  has_more: boolean;
+}
+
+export interface PacketStatusUpdate {
+  seq: number;
+  packet_id: string;
+  state: string;
+}
+
 const API_BASE = import.meta.env.VITE_API_BASE ?? 'http://localhost:8000';
 
+const CONDITIONAL_CACHE_LIMIT = 32;
+
+// Latest ETag and body per method + path (query excluded), evicted least-recently-used. `variant` records the
+// query and a body fingerprint the entry answers; only an identical request sends If-None-Match. The cached
+// body is replayed on 304 (GET) or 412 (POST validation endpoints, whose ETag is a digest of the request body).
+const conditionalCache = new Map<string, { variant: string; etag: string; body: unknown }>();
+
+// FNV-1a; a collision only costs a full response, since the server compares against its own digest.
+function fingerprint(value: string): string {
+  let hash = 0x811c9dc5;
+  for (let index = 0; index < value.length; index += 1) {
+    hash = Math.imul(hash ^ value.charCodeAt(index), 0x01000193);
+  }
+  return `${(hash >>> 0).toString(16)}:${value.length}`;
+}
+
+function rememberConditional(cacheKey: string, entry: { variant: string; etag: string; body: unknown }) {
+  conditionalCache.delete(cacheKey);
+  conditionalCache.set(cacheKey, entry);
+  if (conditionalCache.size > CONDITIONAL_CACHE_LIMIT) {
+    conditionalCache.delete(conditionalCache.keys().next().value as string);
+  }
+}
+
 async function request<T>(path: string, init?: RequestInit): Promise<T> {
+  const method = init?.method ?? 'GET';
+  const [pathname, query = ''] = path.split('?', 2);
+  const cacheKey = `${method} ${pathname}`;
+  const variant = `${query}#${typeof init?.body === 'string' ? fingerprint(init.body) : ''}`;
+  const entry = conditionalCache.get(cacheKey);
+  const cached = entry?.variant === variant ? entry : undefined;
   const response = await fetch(`${API_BASE}${path}`, {
     ...init,
     headers: {
       'Content-Type': 'application/json',
+      ...(cached ? { 'If-None-Match': cached.etag } : {}),
       ...(init?.headers ?? {}),
     },
   });
 
+  const notModified = method === 'GET' || method === 'HEAD' ? 304 : 412;
+  if (response.status === notModified && cached) {
+    rememberConditional(cacheKey, cached);
+    return cached.body as T;
+  }
+
   if (!response.ok) {
     const body = await response.text();
     throw new Error(`API ${response.status}: ${body}`);
   }
 
-  return (await response.json()) as T;
+  const body = (await response.json()) as T;
+  const etag = response.headers.get('ETag');
+  if (etag) {
+    rememberConditional(cacheKey, { variant, etag, body });
+  }
+  return body;
 }
 
 export function validateIntake(payload: IntakePayload): Promise<IntakeValidationResponse> {
@@ -178,6 +233,33 @@ export function listAuditEvents(): Promise<AuditEvent[]> {
   return request('/audit/events');
 }
 
+export function fetchAuditDelta(since?: string | number | null): Promise<AuditDelta> {
+  const query = since === undefined || since === null ? '' : `?since=${encodeURIComponent(String(since))}`;
+  return request(`/audit/delta${query}`);
+}
+
+export function subscribeAuditStream(
+  handlers: {
+    onAuditEvent?: (event: AuditEvent) => void;
+    onPacketStatus?: (update: PacketStatusUpdate) => void;
+    onError?: (event: Event) => void;
+  },
+  since?: string | number | null,
+): () => void {
+  const query = since === undefined || since === null ? '' : `?since=${encodeURIComponent(String(since))}`;
+  const source = new EventSource(`${API_BASE}/audit/stream${query}`);
+  source.addEventListener('audit', (message) => {
+    handlers.onAuditEvent?.(JSON.parse((message as MessageEvent<string>).data) as AuditEvent);
+  });
+  source.addEventListener('packet_status', (message) => {
+    handlers.onPacketStatus?.(JSON.parse((message as MessageEvent<string>).data) as PacketStatusUpdate);
+  });
+  if (handlers.onError) {
+    source.onerror = handlers.onError;
+  }
+  return () => source.close();
+}
+
 export function appendAuditEvent(event: AuditEvent): Promise<AuditEvent> {
   return request('/audit/events', { method: 'POST', body: JSON.stringify(event) });
 }
@@ -1,5 +1,16 @@
-import { FormEvent, useEffect, useMemo, useState } from 'react';
-import { AuditEvent, appendAuditEvent, listAuditEvents } from '../lib/api';
+import { FormEvent, useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import { AuditEvent, appendAuditEvent, fetchAuditDelta, subscribeAuditStream } from '../lib/api';
+
+// Pages through /audit/delta from `since` and returns the events plus the seq of the last one loaded.
+async function loadDeltaPages(since?: string | number | null): Promise<{ events: AuditEvent[]; lastSeq: number | null }> {
+  let delta = await fetchAuditDelta(since);
+  const loaded = [...delta.events];
+  while (delta.has_more) {
+    delta = await fetchAuditDelta(delta.next_seq - 1);
+    loaded.push(...delta.events);
+  }
+  return { events: loaded, lastSeq: delta.next_seq > 0 ? delta.next_seq - 1 : null };
+}
 
 export function AuditTimelinePage() {
   const [events, setEvents] = useState<AuditEvent[]>([]);
@@ -9,14 +20,26 @@ export function AuditTimelinePage() {
   const [error, setError] = useState('');
   const [loading, setLoading] = useState(false);
 
+  // Hashes already on the timeline, kept alongside `events` so merging is linear in the incoming batch.
+  const seenHashes = useRef(new Set<string>());
+
   const previousHash = useMemo(() => events.at(-1)?.hash ?? null, [events]);
 
+  const mergeEvents = useCallback((incoming: AuditEvent[]) => {
+    const fresh = incoming.filter((event) => !event.hash || !seenHashes.current.has(event.hash));
+    if (!fresh.length) {
+      return;
+    }
+    fresh.forEach((event) => event.hash && seenHashes.current.add(event.hash));
+    setEvents((current) => [...current, ...fresh]);
+  }, []);
+
   const loadEvents = async () => {
     setLoading(true);
     setError('');
     try {
-      const response = await listAuditEvents();
-      setEvents(response);
+      const { events: loaded } = await loadDeltaPages(events.at(-1)?.hash);
+      mergeEvents(loaded);
     } catch (apiError) {
       setError(apiError instanceof Error ? apiError.message : 'Failed to load audit timeline');
     } finally {
@@ -25,8 +48,35 @@ export function AuditTimelinePage() {
   };
 
   useEffect(() => {
-    void loadEvents();
-  }, []);
+    let active = true;
+    let unsubscribe: (() => void) | undefined;
+
+    // Backfill with paged deltas, then stream only what arrives after the last loaded event.
+    setLoading(true);
+    loadDeltaPages()
+      .then(({ events: loaded, lastSeq }) => {
+        if (!active) {
+          return;
+        }
+        mergeEvents(loaded);
+        unsubscribe = subscribeAuditStream({ onAuditEvent: (event) => mergeEvents([event]) }, lastSeq);
+      })
+      .catch((apiError) => {
+        if (active) {
+          setError(apiError instanceof Error ? apiError.message : 'Failed to load audit timeline');
+        }
+      })
+      .finally(() => {
+        if (active) {
+          setLoading(false);
+        }
+      });
+
+    return () => {
+      active = false;
+      unsubscribe?.();
+    };
+  }, [mergeEvents]);
 
   const append = async (event: FormEvent) => {
     event.preventDefault();
@@ -44,7 +94,7 @@ export function AuditTimelinePage() {
       };
 
       const appended = await appendAuditEvent(newEvent);
-      setEvents((current) => [...current, appended]);
+      mergeEvents([appended]);
     } catch (apiError) {
       setError(apiError instanceof Error ? apiError.message : 'Failed to append event');
     }
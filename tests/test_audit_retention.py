@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models import AuditEvent
+from app.retention import AuditRetentionManager
+from app.services import ImmutableAuditLog
+
+
+START = datetime(2014, 1, 1, tzinfo=timezone.utc)
+
+
+def append_events(log: ImmutableAuditLog, count: int) -> None:
+    for _ in range(count):
+        seq = log.base_seq + len(log.events)
+        log.append(
+            AuditEvent(
+                event_id=f"evt-{seq}",
+                event_type="prompt_captured",
+                actor="user",
+                timestamp=START + timedelta(days=seq),
+                payload={"seq": seq, "text": "line one\nline two"},
+                previous_event_hash=log.head_hash,
+            )
+        )
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_sealed_events_are_served_from_cold_segments(tmp_path, codec):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path, codec=codec, block_size=4)
+    append_events(log, 10)
+
+    segment = manager.seal(7)
+
+    assert segment is not None
+    assert [block.first_seq for block in segment.index] == [0, 4]
+    assert log.base_seq == 7
+    assert len(log.events) == 3
+    assert manager.get(5).event_id == "evt-5"
+    assert manager.get(8).event_id == "evt-8"
+    assert [seq for seq, _ in manager.iter_events(5)] == [5, 6, 7, 8, 9]
+
+
+def test_chain_verifies_across_hot_and_cold_boundaries(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path, block_size=3)
+    append_events(log, 5)
+    manager.seal()
+    append_events(log, 5)
+    manager.seal(2)
+    append_events(log, 1)
+
+    report = manager.verify_chain()
+
+    assert report.valid is True
+    assert report.checked_events == 11
+    assert report.head_hash == log.head_hash
+
+
+def test_legal_hold_pins_segment_against_purge(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path, retention=timedelta(days=365))
+    append_events(log, 3)
+    held = manager.seal()
+    append_events(log, 3)
+    expiring = manager.seal()
+
+    manager.place_legal_hold(held.segment_id, actor="legal", reason="litigation")
+    purged = manager.purge_expired(actor="records", now=START + timedelta(days=2000))
+
+    assert [segment.segment_id for segment in purged] == [expiring.segment_id]
+    assert manager.get(0).event_id == "evt-0"
+    with pytest.raises(KeyError):
+        manager.get(4)
+    actions = [event.payload["action"] for event in log.events if event.event_type == "role_action"]
+    assert actions == ["legal_hold_placed", "retention_purge"]
+    report = manager.verify_chain()
+    assert report.valid is True
+    assert report.purged_segments == 1
+
+
+def test_tampered_segment_fails_verification(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path)
+    append_events(log, 3)
+    segment = manager.seal()
+
+    path = tmp_path / f"{segment.segment_id}.zlib"
+    path.chmod(0o644)
+    path.write_bytes(path.read_bytes()[:-1] + b"\x00")
+
+    report = manager.verify_chain()
+
+    assert report.valid is False
+    assert report.issues[0].code == "CHAIN-SEGMENT-CHECKSUM"
+
+
+def test_seal_keeps_the_chain_head_hot(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path)
+    append_events(log, 4)
+
+    segment = manager.seal()
+
+    assert segment.last_seq == 2
+    assert [event.hash for event in log.events] == [log.head_hash]
+    assert manager.seal() is None
+
+
+def test_restart_resumes_chain_from_manifests(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path, block_size=2)
+    append_events(log, 5)
+    manager.seal()
+    head = log.events[-1]
+
+    # A restarted process: the head that was still hot is lost, the chain resumes after the sealed range.
+    restarted = ImmutableAuditLog()
+    resumed = AuditRetentionManager(restarted, tmp_path, block_size=2)
+    restarted.append(head)
+    append_events(restarted, 2)
+    segment = resumed.seal()
+
+    assert restarted.base_seq == 6
+    assert segment.segment_id == "seg-000000000004-000000000005"
+    assert resumed.get(1).event_id == "evt-1"
+    assert resumed.verify_chain().valid is True
+
+
+def test_unrecoverable_segment_directory_is_rejected(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path)
+    append_events(log, 3)
+    segment = manager.seal()
+    (tmp_path / f"{segment.segment_id}.json").unlink()
+
+    with pytest.raises(ValueError, match="without a manifest"):
+        AuditRetentionManager(ImmutableAuditLog(), tmp_path)
+
+
+def test_deleted_segment_file_is_reported_not_raised(tmp_path):
+    log = ImmutableAuditLog()
+    manager = AuditRetentionManager(log, tmp_path)
+    append_events(log, 3)
+    segment = manager.seal()
+    (tmp_path / f"{segment.segment_id}.zlib").unlink()
+
+    report = manager.verify_chain()
+
+    assert report.valid is False
+    assert [issue.code for issue in report.issues] == ["CHAIN-SEGMENT-MISSING"]
+    with pytest.raises(KeyError):
+        manager.get(0)
+    with pytest.raises(ValueError, match="without a segment file"):
+        AuditRetentionManager(ImmutableAuditLog(), tmp_path)
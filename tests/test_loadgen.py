@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+import app.main as main
+from app.loadgen import LoadProfile, run_load
+from app.loadgen.runner import percentile
+from app.retention import AuditRetentionManager
+from app.services import ImmutableAuditLog
+from app.workflow import PacketLifecycleService
+
+
+@pytest.fixture
+def isolated_app(monkeypatch, tmp_path):
+    log = ImmutableAuditLog()
+    monkeypatch.setattr(main, "audit_log", log)
+    monkeypatch.setattr(main, "audit_retention", AuditRetentionManager(log, tmp_path))
+    monkeypatch.setattr(main, "packet_lifecycle", PacketLifecycleService(log))
+    return main.app
+
+
+def test_in_process_run_reports_latencies_and_consistent_chain(isolated_app):
+    profile = LoadProfile(
+        agents=4, iterations=3, mix={"workflow": 1, "poll": 1}, invalid_ratio=0, max_chain_retries=50
+    )
+
+    report = asyncio.run(run_load(profile, app=isolated_app))
+
+    operations = {stats.operation: stats for stats in report.operations}
+    assert report.requests > 0
+    assert report.error_rate == 0
+    assert report.chain_retries_exhausted == 0
+    assert report.audit_chain_valid is True
+    assert report.audit_events_checked == len(main.audit_log.events)
+    assert {"intake_validate", "statements_validate", "packet_transition", "audit_append"} <= set(operations)
+    assert operations["audit_append"].p50_ms <= operations["audit_append"].p99_ms
+
+
+def test_failed_steps_do_not_count_as_completed_workflows(isolated_app):
+    profile = LoadProfile(agents=2, iterations=2, mix={"workflow": 1}, invalid_ratio=1, max_chain_retries=50)
+
+    report = asyncio.run(run_load(profile, app=isolated_app))
+
+    assert report.requests > 0
+    assert report.workflows_completed == 0
+
+
+def test_profile_rejects_unknown_scenarios():
+    with pytest.raises(ValueError):
+        LoadProfile(mix={"teleport": 1})
+
+
+def test_profile_requires_exactly_one_stop_condition():
+    assert LoadProfile().iterations == 20
+    assert LoadProfile(duration=5).iterations is None
+    with pytest.raises(ValueError):
+        LoadProfile(iterations=None, duration=None)
+    with pytest.raises(ValueError):
+        LoadProfile(iterations=3, duration=5)
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) == 0
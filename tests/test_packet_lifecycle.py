@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.models import HandoffPacket, PacketState
+from app.services import ImmutableAuditLog
+from app.workflow import PacketLifecycleService, PacketTransitionError, SlaScheduler, run_sla_escalations
+
+
+NOW = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+
+
+def build_packet(packet_id: str = "PKT-2026-001", approved: bool = False) -> HandoffPacket:
+    return HandoffPacket.model_validate(
+        {
+            "packet_id": packet_id,
+            "title": "Design handoff",
+            "owner_agent": "Engineering",
+            "target_agent": "RAQA",
+            "source_requirements": [{"id": "REQ-1", "version": "v1"}],
+            "risk_controls": [{"risk_id": "RISK-1", "control_id": "CTRL-1", "verified": True, "severity": "high"}],
+            "acceptance_criteria": [
+                {"id": "AC-1", "statement": "Do thing", "verification_method": "test", "evidence_ref": "EV-1"}
+            ],
+            "evidence_index": ["EV-1"],
+            "required_approvers": ["RA&QA"],
+            "approval_log": (
+                [{"signer_role": "RA&QA", "decision": "approved", "timestamp": NOW.isoformat()}] if approved else []
+            ),
+        }
+    )
+
+
+def test_packet_moves_through_review_and_records_audit_events():
+    log = ImmutableAuditLog()
+    service = PacketLifecycleService(log)
+    service.register(build_packet(), actor="Engineering", now=NOW)
+
+    service.transition("PKT-2026-001", PacketState.submitted, "Engineering", now=NOW)
+    service.transition("PKT-2026-001", PacketState.in_review, "RAQA", now=NOW)
+    status = service.transition(
+        "PKT-2026-001", PacketState.approved, "RAQA", packet=build_packet(approved=True), now=NOW
+    )
+
+    assert status.state == PacketState.approved
+    assert status.sla_deadline is None
+    transitions = [event.payload["to_state"] for event in log.events]
+    assert transitions == ["draft", "submitted", "in_review", "approved"]
+
+
+def test_illegal_and_gated_transitions_are_denied_and_logged():
+    log = ImmutableAuditLog()
+    service = PacketLifecycleService(log)
+    service.register(build_packet(), actor="Engineering", now=NOW)
+
+    with pytest.raises(PacketTransitionError) as illegal:
+        service.transition("PKT-2026-001", PacketState.approved, "RAQA", now=NOW)
+    assert [issue.code for issue in illegal.value.issues] == ["TRANSITION-NOT-PERMITTED"]
+
+    service.transition("PKT-2026-001", PacketState.submitted, "Engineering", now=NOW)
+    service.transition("PKT-2026-001", PacketState.in_review, "RAQA", now=NOW)
+    with pytest.raises(PacketTransitionError) as gated:
+        service.transition("PKT-2026-001", PacketState.approved, "RAQA", now=NOW)
+
+    assert [issue.code for issue in gated.value.issues] == ["PACKET-REQUIRED-APPROVALS"]
+    assert service.status("PKT-2026-001").state == PacketState.in_review
+    assert log.events[-1].payload["outcome"] == "blocked"
+
+
+def test_sla_escalations_only_cover_overdue_packets():
+    log = ImmutableAuditLog()
+    service = PacketLifecycleService(log, review_sla=timedelta(hours=4), rework_sla=timedelta(days=1))
+    for index in range(3):
+        packet_id = f"PKT-{index}"
+        service.register(build_packet(packet_id), actor="Engineering", now=NOW)
+        service.transition(packet_id, PacketState.submitted, "Engineering", now=NOW)
+    service.transition("PKT-1", PacketState.in_review, "RAQA", now=NOW + timedelta(hours=1))
+    service.transition("PKT-1", PacketState.changes_requested, "RAQA", comment="Add V&V", now=NOW)
+
+    raised = service.escalate_overdue(now=NOW + timedelta(hours=5))
+
+    assert [(item.packet_id, item.escalate_to) for item in raised] == [
+        ("PKT-0", "Team Leader"),
+        ("PKT-2", "Team Leader"),
+    ]
+    assert raised[0].deadline == NOW + timedelta(hours=4)
+    escalation_events = [event for event in log.events if event.payload["action"] == "sla_escalation"]
+    assert [item.escalated_at for item in raised] == [event.timestamp for event in escalation_events]
+    service.transition("PKT-0", PacketState.in_review, "RAQA", now=NOW + timedelta(hours=6))
+    raised = service.escalate_overdue(now=NOW + timedelta(days=2))
+    overdue = service.escalations()
+    assert [item.packet_id for item in raised] == ["PKT-1"]
+    assert [(item.packet_id, item.kind) for item in overdue] == [("PKT-2", "review_start"), ("PKT-1", "rework")]
+
+
+def test_sla_driver_escalates_without_reads():
+    log = ImmutableAuditLog()
+    service = PacketLifecycleService(log, review_sla=timedelta(hours=4))
+    service.register(build_packet(), actor="Engineering", now=NOW)
+    service.transition("PKT-2026-001", PacketState.submitted, "Engineering", now=NOW)
+
+    async def drive() -> None:
+        driver = asyncio.create_task(run_sla_escalations(service, interval=0.01))
+        while not any(event.payload["action"] == "sla_escalation" for event in log.events):
+            await asyncio.sleep(0.01)
+        driver.cancel()
+
+    asyncio.run(asyncio.wait_for(drive(), timeout=2))
+
+    assert [item.packet_id for item in service.escalations()] == ["PKT-2026-001"]
+
+
+def test_sla_scheduler_skips_cancelled_and_rescheduled_deadlines():
+    scheduler = SlaScheduler()
+    scheduler.schedule("a", "review_start", NOW)
+    scheduler.schedule("b", "review_start", NOW)
+    scheduler.schedule("a", "rework", NOW + timedelta(days=1))
+    scheduler.cancel("b")
+
+    assert scheduler.pop_expired(NOW + timedelta(hours=1)) == []
+    assert scheduler.pop_expired(NOW + timedelta(days=1)) == [("a", "rework", NOW + timedelta(days=1))]
+    assert len(scheduler) == 0
+
+
+def test_transition_endpoint_returns_denial_codes(monkeypatch):
+    monkeypatch.setattr(main, "packet_lifecycle", PacketLifecycleService(ImmutableAuditLog()))
+    client = TestClient(main.app)
+
+    registered = client.post(
+        "/workflow/packets",
+        json={"packet": build_packet().model_dump(mode="json"), "actor": "Engineering"},
+    )
+    denied = client.post(
+        "/workflow/packets/PKT-2026-001/transitions",
+        json={"to_state": "in_review", "actor": "RAQA"},
+    )
+
+    assert registered.status_code == 200
+    assert registered.json()["state"] == "draft"
+    assert denied.status_code == 409
+    assert denied.json()["detail"]["issues"][0]["code"] == "TRANSITION-NOT-PERMITTED"
+    assert client.get("/workflow/packets/escalations").json() == []
+    assert client.get("/workflow/packets/PKT-404").status_code == 404
@@ -0,0 +1,203 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+from app.models import ProcedureGateRequest, ProcedureObject
+from app.procedures import ProcedureRegistry
+from app.services import ImmutableAuditLog
+
+
+JAN = datetime(2026, 1, 15, tzinfo=timezone.utc)
+MAR = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def build_procedure(revision: str = "Rev. 03", effective_date: datetime = JAN) -> ProcedureObject:
+    return ProcedureObject.model_validate(
+        {
+            "sop_id": "SOP-QMS-042",
+            "revision": revision,
+            "effective_date": effective_date.isoformat(),
+            "owner": {"role": "Quality Systems Manager", "user_id": "qsm-001"},
+            "mandatory_steps": [
+                {
+                    "id": "step-1",
+                    "name": "Define intended use",
+                    "evidence_required": ["intended_use_statement"],
+                },
+                {
+                    "id": "step-2",
+                    "name": "Independent quality review",
+                    "approvals_required": [{"role": "Quality Reviewer"}],
+                },
+            ],
+            "role_permissions": {
+                "Regulatory Agent": ["complete_step"],
+                "Quality Reviewer": ["complete_step", "finalize"],
+            },
+            "approval_matrix": ["QA Director"],
+            "signature_requirements": ["QA Director"],
+            "required_records": ["review_checklist"],
+            "exceptions": [
+                {
+                    "code": "EXC-042-EMERGENCY",
+                    "description": "Emergency path",
+                    "preconditions": ["emergency_declared"],
+                    "additional_approvals": [{"role": "QA Director"}],
+                    "expiration_hours": 24,
+                }
+            ],
+        }
+    )
+
+
+def gate_request(**overrides) -> ProcedureGateRequest:
+    fields = {
+        "sop_id": "SOP-QMS-042",
+        "actor": "agent-7",
+        "actor_role": "Regulatory Agent",
+        "action": "complete_step",
+    }
+    return ProcedureGateRequest(**{**fields, **overrides})
+
+
+def test_gate_returns_deterministic_denial_codes():
+    registry = ProcedureRegistry(ImmutableAuditLog())
+    registry.publish(build_procedure(), actor="qsm-001")
+
+    not_permitted = registry.evaluate(gate_request(action="finalize"), at=MAR)
+    out_of_order = registry.evaluate(gate_request(step_id="step-2"), at=MAR)
+    finalize = registry.evaluate(
+        gate_request(actor_role="Quality Reviewer", action="finalize", completed_steps=["step-1"]), at=MAR
+    )
+
+    assert not_permitted.denial_codes == ["GATE-ENTRY-ROLE-NOT-PERMITTED"]
+    assert out_of_order.denial_codes == ["GATE-STEP-OUT-OF-ORDER", "GATE-APPROVAL-MISSING"]
+    assert finalize.denial_codes == [
+        "GATE-STEP-INCOMPLETE",
+        "GATE-APPROVAL-MISSING",
+        "GATE-SIGNATURE-MISSING",
+        "GATE-RECORD-MISSING",
+    ]
+
+
+def test_gate_allows_satisfied_step_and_approved_exception():
+    registry = ProcedureRegistry(ImmutableAuditLog())
+    registry.publish(build_procedure(), actor="qsm-001")
+
+    step = registry.evaluate(gate_request(step_id="step-1", evidence=["intended_use_statement"]), at=MAR)
+    emergency = registry.evaluate(
+        gate_request(
+            step_id="step-2",
+            approvals=["Quality Reviewer", "QA Director"],
+            exception_code="EXC-042-EMERGENCY",
+            exception_started_at=MAR - timedelta(hours=2),
+            conditions=["emergency_declared"],
+        ),
+        at=MAR,
+    )
+
+    assert step.allowed is True
+    assert step.revision == "Rev. 03"
+    assert emergency.allowed is True
+
+
+def test_time_limited_exception_is_denied_once_expired():
+    registry = ProcedureRegistry(ImmutableAuditLog())
+    registry.publish(build_procedure(), actor="qsm-001")
+    fields = {
+        "step_id": "step-2",
+        "approvals": ["Quality Reviewer", "QA Director"],
+        "exception_code": "EXC-042-EMERGENCY",
+        "conditions": ["emergency_declared"],
+    }
+
+    expired = registry.evaluate(gate_request(**fields, exception_started_at=MAR - timedelta(hours=25)), at=MAR)
+    undated = registry.evaluate(gate_request(**fields), at=MAR)
+
+    assert expired.denial_codes == ["GATE-EXCEPTION-EXPIRED", "GATE-STEP-OUT-OF-ORDER"]
+    assert undated.denial_codes == ["GATE-EXCEPTION-START-MISSING", "GATE-STEP-OUT-OF-ORDER"]
+
+
+def test_documented_example_procedure_publishes(monkeypatch):
+    monkeypatch.setattr(main, "procedure_registry", ProcedureRegistry(ImmutableAuditLog()))
+    client = TestClient(main.app)
+    # docs/qms/procedure-model.md §2.3
+    example = {
+        "sop_id": "SOP-QMS-042",
+        "revision": "Rev. 03",
+        "effective_date": "2026-01-15T00:00:00Z",
+        "owner": {"role": "Quality Systems Manager", "user_id": "qsm-001"},
+        "mandatory_steps": [
+            {
+                "id": "step-1",
+                "name": "Define intended use and device classification",
+                "evidence_required": ["intended_use_statement", "classification_rationale"],
+            },
+            {"id": "step-2", "name": "Independent quality review", "approvals_required": [{"role": "Quality Reviewer"}]},
+        ],
+        "exceptions": [
+            {
+                "code": "EXC-042-EMERGENCY",
+                "description": "Time-limited emergency path with post-hoc review",
+                "preconditions": ["emergency_declared == true"],
+                "additional_approvals": [{"role": "QA Director"}],
+                "expiration_hours": 24,
+            }
+        ],
+        "capa_linkage": {
+            "trigger_conditions": ["missing_mandatory_step", "unauthorized_exception"],
+            "default_capa_type": "process_nonconformance",
+        },
+    }
+
+    published = client.post("/procedures", json={"procedure": example, "actor": "qsm-001"})
+    gated = client.post(
+        "/procedures/gate",
+        json={"sop_id": "SOP-QMS-042", "actor": "agent-7", "actor_role": "Quality Reviewer", "action": "complete_step"},
+    )
+
+    assert published.status_code == 200
+    assert gated.json()["denial_codes"] == ["GATE-ENTRY-ROLE-NOT-PERMITTED"]
+
+
+def test_cached_revision_switches_only_when_new_revision_becomes_effective():
+    registry = ProcedureRegistry(ImmutableAuditLog())
+    current = registry.publish(build_procedure(), actor="qsm-001")
+    assert registry.active("SOP-QMS-042", at=JAN) is current
+
+    upcoming = registry.publish(build_procedure("Rev. 04", MAR), actor="qsm-001")
+
+    assert registry.active("SOP-QMS-042", at=datetime(2026, 2, 1, tzinfo=timezone.utc)) is current
+    assert registry.active("SOP-QMS-042", at=MAR) is upcoming
+    assert registry.evaluate(gate_request(), at=datetime(2025, 1, 1, tzinfo=timezone.utc)).denial_codes == [
+        "GATE-ENTRY-NO-EFFECTIVE-REVISION"
+    ]
+
+
+def test_publish_rejects_cyclic_step_order_and_duplicate_revisions():
+    registry = ProcedureRegistry(ImmutableAuditLog())
+    cyclic = build_procedure()
+    cyclic.mandatory_steps[0].depends_on = ["step-2"]
+
+    with pytest.raises(ValueError, match="cycle"):
+        registry.publish(cyclic, actor="qsm-001")
+
+    registry.publish(build_procedure(), actor="qsm-001")
+    with pytest.raises(ValueError, match="already published"):
+        registry.publish(build_procedure(), actor="qsm-001")
+
+
+def test_check_records_gate_decision_in_audit_log():
+    log = ImmutableAuditLog()
+    registry = ProcedureRegistry(log)
+    registry.publish(build_procedure(), actor="qsm-001")
+
+    registry.check(gate_request(step_id="step-2"), at=MAR)
+
+    event = log.events[-1]
+    assert event.payload["action"] == "procedure_gate"
+    assert event.payload["outcome"] == "blocked"
+    assert event.payload["revision"] == "Rev. 03"
@@ -0,0 +1,145 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.models import HandoffPacket, Hazard, ResidualRiskRecord, RiskControl, RiskSeverity
+from app.risk import RiskRegister
+from app.services import ImmutableAuditLog
+
+
+def build_register() -> RiskRegister:
+    register = RiskRegister(ImmutableAuditLog())
+    register.add_hazard(
+        Hazard(hazard_id="HZ-001", device_id="DEV-A", description="Missed arrhythmia", severity="critical"),
+        actor="risk-agent",
+    )
+    register.add_hazard(
+        Hazard(hazard_id="HZ-002", device_id="DEV-A", description="Alarm fatigue", severity="medium"),
+        actor="risk-agent",
+    )
+    register.add_hazard(
+        Hazard(hazard_id="HZ-003", device_id="DEV-B", description="Data loss", severity="high"),
+        actor="risk-agent",
+    )
+    register.add_control(RiskControl(control_id="RM-001", hazard_id="HZ-001", description="Dual review"), "risk-agent")
+    register.add_control(RiskControl(control_id="RM-002", hazard_id="HZ-002", description="Alarm tuning"), "risk-agent")
+    return register
+
+
+def test_rollup_tracks_controls_and_verification_incrementally():
+    register = build_register()
+
+    before = register.rollup("DEV-A")
+    register.verify_control("RM-001", "VNV-010", actor="vnv-agent")
+    after = register.rollup("DEV-A")
+
+    assert before.unverified_high_severity_controls == ["RM-001"]
+    assert before.verified_controls == 0
+    assert after.unverified_high_severity_controls == []
+    assert after.verified_controls == 1
+    assert register.rollup("DEV-B").hazards_without_controls == ["HZ-003"]
+    assert [control.control_id for control in register.controls_for_verification("VNV-010")] == ["RM-001"]
+
+
+def test_unverified_controls_filter_by_device_and_severity():
+    register = build_register()
+    register.add_control(RiskControl(control_id="RM-003", hazard_id="HZ-003", description="Backups"), "risk-agent")
+
+    critical = register.unverified_controls("DEV-A", {RiskSeverity.critical})
+    medium = register.unverified_controls("DEV-A", {RiskSeverity.medium})
+
+    assert [control.control_id for control in critical] == ["RM-001"]
+    assert [control.control_id for control in medium] == ["RM-002"]
+
+
+def test_residual_risk_counts_and_acceptance_rationale():
+    register = build_register()
+
+    with pytest.raises(ValueError):
+        register.record_residual(
+            ResidualRiskRecord(hazard_id="HZ-001", residual_severity="low", acceptable=True), actor="risk-agent"
+        )
+    register.record_residual(
+        ResidualRiskRecord(hazard_id="HZ-001", residual_severity="high", acceptable=False), actor="risk-agent"
+    )
+    register.record_residual(
+        ResidualRiskRecord(hazard_id="HZ-001", residual_severity="low", acceptable=True, rationale="Benefit"),
+        actor="risk-agent",
+    )
+
+    rollup = register.rollup("DEV-A")
+    assert (rollup.residual_acceptable, rollup.residual_unacceptable, rollup.residual_pending) == (1, 0, 1)
+
+
+def test_packet_risk_links_feed_the_register():
+    register = RiskRegister(ImmutableAuditLog())
+    packet = HandoffPacket.model_validate(
+        {
+            "packet_id": "PKT-2026-001",
+            "title": "Design handoff",
+            "owner_agent": "Engineering",
+            "target_agent": "RAQA",
+            "source_requirements": [],
+            "risk_controls": [
+                {"risk_id": "RISK-1", "control_id": "CTRL-1", "verified": False, "severity": "High"},
+                {"risk_id": "RISK-2", "control_id": "CTRL-2", "verified": True, "severity": "critical"},
+            ],
+            "acceptance_criteria": [],
+            "evidence_index": ["EV-1"],
+            "required_approvers": [],
+            "approval_log": [],
+        }
+    )
+
+    register.ingest_packet("DEV-A", packet, actor="Engineering")
+
+    rollup = register.rollup("DEV-A")
+    assert rollup.unverified_high_severity_controls == ["CTRL-1"]
+    assert register.control("CTRL-2").verification_refs == ["PKT-2026-001"]
+    assert register.controls_for_verification("EV-1") == []
+
+
+def test_packet_links_must_match_registered_records():
+    register = build_register()
+    link = {"risk_id": "HZ-001", "control_id": "RM-001", "verified": False, "severity": "critical"}
+
+    def packet(**overrides) -> HandoffPacket:
+        return HandoffPacket.model_validate(
+            {
+                "packet_id": "PKT-2026-002",
+                "title": "Design handoff",
+                "owner_agent": "Engineering",
+                "target_agent": "RAQA",
+                "source_requirements": [],
+                "risk_controls": [{**link, **overrides}],
+                "acceptance_criteria": [],
+                "evidence_index": [],
+                "required_approvers": [],
+                "approval_log": [],
+            }
+        )
+
+    with pytest.raises(ValueError, match="already controls HZ-001"):
+        register.ingest_packet("DEV-A", packet(risk_id="HZ-009"), actor="Engineering")
+    with pytest.raises(ValueError, match="belongs to device DEV-A"):
+        register.ingest_packet("DEV-B", packet(), actor="Engineering")
+    with pytest.raises(ValueError, match="severity critical"):
+        register.ingest_packet("DEV-A", packet(severity="low"), actor="Engineering")
+
+    register.ingest_packet("DEV-A", packet(verified=True), actor="Engineering")
+
+    assert "HZ-009" not in register.rollup("DEV-A").hazards_without_controls
+    assert register.control("RM-001").verification_refs == ["PKT-2026-002"]
+
+
+def test_unverified_controls_endpoint_defaults_to_high_severities(monkeypatch):
+    monkeypatch.setattr(main, "risk_register", build_register())
+    client = TestClient(main.app)
+
+    default = client.get("/risk/devices/DEV-A/controls/unverified")
+    medium = client.get("/risk/devices/DEV-A/controls/unverified", params={"severity": "medium"})
+
+    assert [control["control_id"] for control in default.json()] == ["RM-001"]
+    assert default.json()[0]["verified"] is False
+    assert [control["control_id"] for control in medium.json()] == ["RM-002"]
+    assert client.get("/risk/devices/DEV-A/rollup").json()["controls"] == 2
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.retention import AuditRetentionManager
+from app.services import ImmutableAuditLog
+from app.sync import AuditNotifier, audit_event_stream, etag_matches
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    log = ImmutableAuditLog()
+    monkeypatch.setattr(main, "audit_log", log)
+    monkeypatch.setattr(main, "audit_retention", AuditRetentionManager(log, tmp_path, block_size=2))
+    for index in range(3):
+        log.record_action("agent", "draft_statement", {"index": index})
+    return TestClient(main.app)
+
+
+def test_audit_list_honours_if_none_match(client):
+    first = client.get("/audit/events")
+    etag = first.headers["ETag"]
+
+    unchanged = client.get("/audit/events", headers={"If-None-Match": etag})
+    main.audit_log.record_action("agent", "draft_statement", {"index": 3})
+    changed = client.get("/audit/events", headers={"If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert changed.status_code == 200
+    assert len(changed.json()) == 4
+
+
+def test_delta_returns_only_new_events_by_seq_or_hash(client):
+    main.audit_retention.seal(2)
+    everything = client.get("/audit/delta").json()
+    cursor_hash = everything["events"][0]["hash"]
+
+    by_seq = client.get("/audit/delta", params={"since": 0}).json()
+    by_hash = client.get("/audit/delta", params={"since": cursor_hash}).json()
+    paged = client.get("/audit/delta", params={"since": 0, "limit": 1}).json()
+
+    assert [event["payload"]["index"] for event in everything["events"]] == [0, 1, 2]
+    assert [event["payload"]["index"] for event in by_seq["events"]] == [1, 2]
+    assert by_hash == by_seq
+    assert paged["has_more"] is True
+    assert paged["next_seq"] == 2
+    assert client.get("/audit/delta", params={"since": "not-a-hash"}).status_code == 404
+
+
+def test_delta_rejects_numeric_cursor_past_head(client):
+    caught_up = client.get("/audit/delta", params={"since": 2})
+    past_head = client.get("/audit/delta", params={"since": 100})
+
+    assert caught_up.status_code == 200
+    assert caught_up.json()["events"] == []
+    assert past_head.status_code == 400
+    assert client.get("/audit/stream", params={"since": 100}).status_code == 400
+
+
+def test_delta_at_head_is_not_modified(client):
+    delta = client.get("/audit/delta")
+
+    caught_up = client.get(
+        "/audit/delta",
+        params={"since": delta.json()["head_hash"]},
+        headers={"If-None-Match": delta.headers["ETag"]},
+    )
+
+    assert caught_up.status_code == 304
+
+
+def test_validation_responses_carry_cache_key_etag(client):
+    packet = {
+        "packet_id": "PKT-2026-001",
+        "title": "Design handoff",
+        "owner_agent": "Engineering",
+        "target_agent": "RAQA",
+        "source_requirements": [],
+        "risk_controls": [],
+        "acceptance_criteria": [],
+        "evidence_index": ["EV-1"],
+        "required_approvers": ["RA&QA"],
+        "approval_log": [],
+    }
+
+    first = client.post("/workflow/packets/validate", json=packet)
+    repeat = client.post("/workflow/packets/validate", json=packet, headers={"If-None-Match": first.headers["ETag"]})
+    changed = client.post(
+        "/workflow/packets/validate",
+        json={**packet, "required_approvers": []},
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert first.status_code == 200
+    assert first.json()["acceptable"] is False
+    assert repeat.status_code == 412
+    assert repeat.headers["ETag"] == first.headers["ETag"]
+    assert changed.status_code == 200
+    assert changed.json()["acceptable"] is True
+    assert client.post("/workflow/packets/validate", json=packet, headers={"If-None-Match": "*"}).status_code == 200
+
+
+def test_etag_matching_handles_lists_and_weak_tags():
+    assert etag_matches('W/"a", "b"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches("*", '"a"', allow_wildcard=False)
+    assert not etag_matches(None, '"a"')
+
+
+def test_stream_pushes_new_audit_events_and_packet_status(tmp_path):
+    log = ImmutableAuditLog()
+    notifier = AuditNotifier()
+    log.add_listener(notifier)
+    retention = AuditRetentionManager(log, tmp_path)
+    log.record_action("agent", "draft_statement", {})
+
+    async def collect() -> list[str]:
+        stream = audit_event_stream(retention, notifier, cursor=0, heartbeat=5)
+        frames = [await anext(stream)]
+        log.record_action(
+            "RAQA",
+            "packet_transition",
+            {"packet_id": "PKT-1", "from_state": "draft", "to_state": "submitted"},
+        )
+        frames.append(await asyncio.wait_for(anext(stream), timeout=1))
+        frames.append(await asyncio.wait_for(anext(stream), timeout=1))
+        await stream.aclose()
+        return frames
+
+    frames = asyncio.run(collect())
+
+    assert frames[0].startswith("event: audit\nid: 0\n")
+    assert frames[1].startswith("event: audit\nid: 1\n")
+    assert frames[2].startswith("event: packet_status\n")
+    assert '"state": "submitted"' in frames[2]
+
+
+def test_stream_replays_sealed_segments_in_pages(tmp_path):
+    log = ImmutableAuditLog()
+    notifier = AuditNotifier()
+    retention = AuditRetentionManager(log, tmp_path, block_size=2)
+    for index in range(5):
+        log.record_action("agent", "draft_statement", {"index": index})
+    retention.seal(4)
+
+    async def collect() -> list[str]:
+        stream = audit_event_stream(retention, notifier, cursor=1, heartbeat=5, page_size=2)
+        frames = [await asyncio.wait_for(anext(stream), timeout=1) for _ in range(4)]
+        await stream.aclose()
+        return frames
+
+    frames = asyncio.run(collect())
+
+    assert [frame.split("\n")[1] for frame in frames] == ["id: 1", "id: 2", "id: 3", "id: 4"]